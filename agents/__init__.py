@@ -0,0 +1,3 @@
+"""
+Credit risk agents, workflow definitions and MCP/database tools
+"""
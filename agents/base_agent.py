@@ -9,7 +9,7 @@ import logging
 import time
 import asyncio
 from typing import Dict, List, Any, Optional, Union, Callable
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
 from datetime import datetime, timedelta
 from abc import ABC, abstractmethod
 import traceback
@@ -60,14 +60,22 @@ class AgentConfig:
         if self.timeout < 0:
             raise ValueError("timeout must be non-negative")
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class AgentContext:
-    """Context for agent operations"""
+    """Context for agent operations
+    
+    Contexts are shared by concurrently running tasks and must not be
+    mutated, including their metadata; derive a copy with with_metadata().
+    """
     session_id: str
     user_id: Optional[str] = None
     request_id: Optional[str] = None
     metadata: Dict[str, Any] = field(default_factory=dict)
     created_at: datetime = field(default_factory=datetime.now)
+    
+    def with_metadata(self, **metadata: Any) -> "AgentContext":
+        """Return a copy with the given metadata entries added or replaced"""
+        return replace(self, metadata={**self.metadata, **metadata})
 
 @dataclass
 class AgentResult:
@@ -14,9 +14,23 @@ from datetime import datetime, timedelta
 import mysql.connector
 from mysql.connector import pooling
 import os
+import functools
 from contextlib import contextmanager
 import numpy as np
 
+# Optional C-based driver: mysqlclient (MySQLdb) pooled through DBUtils
+try:
+    import MySQLdb
+    from MySQLdb.cursors import DictCursor
+    from dbutils.pooled_db import PooledDB
+except ImportError:
+    MySQLdb = None
+
+SUPPORTED_DRIVERS = ('connector', 'mysqlclient')
+
+# Errors raised by any of the supported drivers
+DB_ERRORS = (mysql.connector.Error,) + ((MySQLdb.Error,) if MySQLdb else ())
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -24,7 +38,49 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-@dataclass
+def _create_mysqlclient_pool(pool_config: Dict[str, Any]):
+    """Create a DBUtils pool of mysqlclient connections from connector-style settings"""
+    if MySQLdb is None:
+        raise ImportError("mysqlclient driver requires the 'mysqlclient' and 'DBUtils' packages")
+    
+    return PooledDB(
+        creator=MySQLdb,
+        maxconnections=pool_config['pool_size'],
+        blocking=True,
+        reset=pool_config['pool_reset_session'],
+        host=pool_config['host'],
+        port=pool_config['port'],
+        db=pool_config['database'],
+        user=pool_config['user'],
+        passwd=pool_config['password'],
+        charset=pool_config['charset'],
+        use_unicode=pool_config['use_unicode'],
+        autocommit=pool_config['autocommit'],
+        init_command=f"SET time_zone = '{pool_config['time_zone']}'",
+        cursorclass=DictCursor
+    )
+
+@functools.lru_cache(maxsize=8)
+def _shared_pool(driver: str, pool_key: tuple):
+    """Return the process-wide connection pool for a given driver and pool configuration"""
+    if driver == 'mysqlclient':
+        return _create_mysqlclient_pool(dict(pool_key))
+    return pooling.MySQLConnectionPool(**dict(pool_key))
+
+# Column names of market_data, loaded on first use to validate requested indicators
+_MARKET_COLUMNS: Optional[frozenset] = None
+
+@functools.lru_cache(maxsize=64)
+def _historical_market_query(indicators: tuple) -> str:
+    """Build the historical market data query for a canonical (sorted) indicator tuple"""
+    return f"""
+                SELECT date, {', '.join(indicators)}
+                FROM market_data 
+                WHERE date BETWEEN %s AND %s
+                ORDER BY date
+            """
+
+@dataclass(slots=True)
 class DatabaseResult:
     """Result from database operation"""
     success: bool
@@ -50,6 +106,10 @@ class DatabaseConfig:
         self.use_unicode = config.get('use_unicode', True)
         self.pool_size = int(config.get('pool_size', 10))
         self.pool_name = config.get('pool_name', 'agent_pool')
+        self.driver = config.get('driver') or os.getenv('DB_DRIVER', 'connector')
+        
+        if self.driver not in SUPPORTED_DRIVERS:
+            raise ValueError(f"Unsupported database driver: {self.driver}")
         
         # Connection pool configuration
         self.pool_config = {
@@ -79,10 +139,13 @@ class BaseDatabaseTool:
     def _initialize_pool(self):
         """Initialize database connection pool"""
         try:
-            self.pool = pooling.MySQLConnectionPool(**self.config.pool_config)
-            self.logger.info(f"Database connection pool initialized: {self.config.pool_name}")
-        except mysql.connector.Error as e:
-            self.logger.error(f"Failed to initialize connection pool: {str(e)}")
+            # Tools sharing the same configuration reuse a single pool
+            pool_key = tuple(sorted(self.config.pool_config.items()))
+            self.pool = _shared_pool(self.config.driver, pool_key)
+            self.logger.info("Database connection pool initialized: %s (%s)",
+                             self.config.pool_name, self.config.driver)
+        except DB_ERRORS as e:
+            self.logger.error("Failed to initialize connection pool: %s", e)
             raise
     
     @contextmanager
@@ -92,10 +155,13 @@ class BaseDatabaseTool:
         try:
             if self.pool is None:
                 raise mysql.connector.Error("Connection pool not initialized")
-            conn = self.pool.get_connection()
+            if self.config.driver == 'mysqlclient':
+                conn = self.pool.connection()
+            else:
+                conn = self.pool.get_connection()
             yield conn
-        except mysql.connector.Error as e:
-            self.logger.error(f"Database connection error: {str(e)}")
+        except DB_ERRORS as e:
+            self.logger.error("Database connection error: %s", e)
             raise
         finally:
             if conn:
@@ -104,16 +170,20 @@ class BaseDatabaseTool:
     def execute_query(self, query: str, params: Optional[tuple] = None, 
                      fetch_one: bool = False, fetch_all: bool = True) -> DatabaseResult:
         """Execute database query with error handling"""
-        start_time = time.time()
+        start_time = time.perf_counter()
         
         try:
             with self.get_connection() as conn:
-                cursor = conn.cursor(dictionary=True)
+                # mysqlclient pools are created with DictCursor as the cursor class
+                if self.config.driver == 'mysqlclient':
+                    cursor = conn.cursor()
+                else:
+                    cursor = conn.cursor(dictionary=True)
                 
-                self.logger.info(f"Executing query: {query[:100]}...")
+                self.logger.debug("Executing query: %.100s...", query)
                 cursor.execute(query, params or ())
                 
-                execution_time = time.time() - start_time
+                execution_time = time.perf_counter() - start_time
                 
                 if fetch_one:
                     result = cursor.fetchone()
@@ -125,7 +195,7 @@ class BaseDatabaseTool:
                 rows_affected = cursor.rowcount
                 cursor.close()
                 
-                self.logger.info(f"Query executed successfully in {execution_time:.3f}s")
+                self.logger.debug("Query executed successfully in %.3fs", execution_time)
                 
                 return DatabaseResult(
                     success=True,
@@ -134,8 +204,8 @@ class BaseDatabaseTool:
                     rows_affected=rows_affected
                 )
                 
-        except mysql.connector.Error as e:
-            execution_time = time.time() - start_time
+        except DB_ERRORS as e:
+            execution_time = time.perf_counter() - start_time
             error_msg = f"Database error: {str(e)}"
             self.logger.error(error_msg)
             
@@ -146,7 +216,7 @@ class BaseDatabaseTool:
             )
         
         except Exception as e:
-            execution_time = time.time() - start_time
+            execution_time = time.perf_counter() - start_time
             error_msg = f"Unexpected error: {str(e)}"
             self.logger.error(error_msg)
             
@@ -165,7 +235,7 @@ class CustomerDatabaseTool(BaseDatabaseTool):
     
     def get_customer(self, customer_id: str) -> DatabaseResult:
         """Get customer details by ID"""
-        self.logger.info(f"Fetching customer: {customer_id}")
+        self.logger.info("Fetching customer: %s", customer_id)
         
         query = """
             SELECT c.customer_id, c.name, c.age, c.email, c.phone, c.annual_income,
@@ -184,64 +254,77 @@ class CustomerDatabaseTool(BaseDatabaseTool):
             result.error = "Customer not found"
         
         return result
+
+    def get_customers(self, customer_ids: List[str]) -> DatabaseResult:
+        """Get details for several customers in a single query, keyed by customer ID"""
+        self.logger.info("Fetching %d customers", len(customer_ids))
+
+        if not customer_ids:
+            return DatabaseResult(success=True, data={})
+
+        placeholders = ', '.join(['%s'] * len(customer_ids))
+        query = f"""
+            SELECT {self._SEARCH_COLUMNS}
+            {self._SEARCH_FROM}
+            WHERE c.customer_id IN ({placeholders})
+        """
+
+        result = self.execute_query(query, tuple(customer_ids), fetch_all=True)
+
+        if result.success:
+            result.data = {row['customer_id']: row for row in result.data or []}
+
+        return result
+
+    # Filter key -> (SQL fragment, parameter adapter, range filter). Range filters
+    # apply whenever the value is not None; the others only when truthy.
+    _FILTER_DEFS = (
+        ('name', 'c.name LIKE %s', lambda v: f"%{v}%", False),
+        ('age_min', 'c.age >= %s', None, True),
+        ('age_max', 'c.age <= %s', None, True),
+        ('income_min', 'c.annual_income >= %s', None, True),
+        ('income_max', 'c.annual_income <= %s', None, True),
+        ('employment_type', 'c.employment_type = %s', None, False),
+        ('state', 'c.state = %s', None, False),
+    )
+    
+    _SEARCH_COLUMNS = """c.customer_id, c.name, c.age, c.email, c.phone, c.annual_income,
+                   c.employment_type, c.employment_years, c.education_level,
+                   c.marital_status, c.dependents, c.address, c.city, c.state, c.zip, 
+                   c.created_at, COALESCE(ch.credit_score, 0) as credit_score"""
+    
+    _SEARCH_FROM = """FROM customers c
+            LEFT JOIN credit_histories ch ON c.customer_id = ch.customer_id"""
     
     def search_customers(self, filters: Dict[str, Any], 
                         limit: int = 100, offset: int = 0) -> DatabaseResult:
         """Search customers with filters"""
-        self.logger.info(f"Searching customers with filters: {filters}")
+        self.logger.info("Searching customers with filters: %s", filters)
         
-        # Build dynamic query with credit_score
-        query = """
-            SELECT c.customer_id, c.name, c.age, c.email, c.phone, c.annual_income,
-                   c.employment_type, c.employment_years, c.education_level,
-                   c.marital_status, c.dependents, c.address, c.city, c.state, c.zip, 
-                   c.created_at, COALESCE(ch.credit_score, 0) as credit_score
-            FROM customers c
-            LEFT JOIN credit_histories ch ON c.customer_id = ch.customer_id
-            WHERE 1=1
-        """
+        # Build WHERE clause from the filter table
+        where_parts = ['1=1']
         params = []
-        
-        # Add search conditions
-        if filters.get('name'):
-            query += " AND c.name LIKE %s"
-            params.append(f"%{filters['name']}%")
-        
-        if filters.get('age_min') is not None:
-            query += " AND c.age >= %s"
-            params.append(filters['age_min'])
-        
-        if filters.get('age_max') is not None:
-            query += " AND c.age <= %s"
-            params.append(filters['age_max'])
-        
-        if filters.get('income_min') is not None:
-            query += " AND c.annual_income >= %s"
-            params.append(filters['income_min'])
-        
-        if filters.get('income_max') is not None:
-            query += " AND c.annual_income <= %s"
-            params.append(filters['income_max'])
-        
-        if filters.get('employment_type'):
-            query += " AND c.employment_type = %s"
-            params.append(filters['employment_type'])
-        
-        if filters.get('state'):
-            query += " AND c.state = %s"
-            params.append(filters['state'])
+        for key, fragment, adapter, is_range in self._FILTER_DEFS:
+            value = filters.get(key)
+            if (value is None) if is_range else (not value):
+                continue
+            where_parts.append(fragment)
+            params.append(adapter(value) if adapter else value)
+        where_clause = ' AND '.join(where_parts)
         
         # Get total count first
-        count_query = query.replace(
-            "SELECT c.customer_id, c.name, c.age, c.email, c.phone, c.annual_income, c.employment_type, c.employment_years, c.education_level, c.marital_status, c.dependents, c.address, c.city, c.state, c.zip, c.created_at, COALESCE(ch.credit_score, 0) as credit_score",
-            "SELECT COUNT(*) as total"
-        )
+        count_query = f"SELECT COUNT(*) as total {self._SEARCH_FROM} WHERE {where_clause}"
         
         count_result = self.execute_query(count_query, tuple(params), fetch_one=True)
         total_count = count_result.data['total'] if count_result.success and count_result.data else 0
         
         # Add pagination
-        query += " ORDER BY c.created_at DESC LIMIT %s OFFSET %s"
+        query = f"""
+            SELECT {self._SEARCH_COLUMNS}
+            {self._SEARCH_FROM}
+            WHERE {where_clause}
+            ORDER BY c.created_at DESC LIMIT %s OFFSET %s
+        """
         params.extend([limit, offset])
         
         result = self.execute_query(query, tuple(params), fetch_all=True)
@@ -258,7 +341,7 @@ class CustomerDatabaseTool(BaseDatabaseTool):
     
     def search_customers_flexible(self, search_term: str, limit: int = 100, offset: int = 0) -> DatabaseResult:
         """Flexible search customers by name, customer_id, or email"""
-        self.logger.info(f"Flexible search for customers with term: {search_term}")
+        self.logger.info("Flexible search for customers with term: %s", search_term)
         
         # Build query that searches across multiple fields and includes credit_score
         query = """
@@ -299,27 +382,33 @@ class CustomerDatabaseTool(BaseDatabaseTool):
     
     def get_financial_summary(self, customer_id: str) -> DatabaseResult:
         """Get comprehensive financial summary for customer"""
-        self.logger.info(f"Fetching financial summary for customer: {customer_id}")
+        self.logger.info("Fetching financial summary for customer: %s", customer_id)
         
+        # The row is serialized server-side into a single JSON payload
         query = """
-            SELECT 
-                c.customer_id,
-                c.name,
-                ch.credit_score,
-                ch.total_credit_limit,
-                ch.credit_utilization,
-                fs.monthly_income,
-                fs.monthly_expenses,
-                fs.checking,
-                fs.savings,
-                fs.investments,
-                fs.real_estate,
-                fs.credit_cards,
-                fs.loans,
-                fs.mortgage,
-                fs.other_debt,
-                COUNT(la.loan_id) as loan_count,
-                COALESCE(SUM(la.loan_amount), 0) as total_loan_amount
+            SELECT JSON_OBJECT(
+                'customer_id', c.customer_id,
+                'name', c.name,
+                'credit_score', ch.credit_score,
+                'total_credit_limit', ch.total_credit_limit,
+                'credit_utilization', ch.credit_utilization,
+                'monthly_income', fs.monthly_income,
+                'monthly_expenses', fs.monthly_expenses,
+                'checking', fs.checking,
+                'savings', fs.savings,
+                'investments', fs.investments,
+                'real_estate', fs.real_estate,
+                'credit_cards', fs.credit_cards,
+                'loans', fs.loans,
+                'mortgage', fs.mortgage,
+                'other_debt', fs.other_debt,
+                'total_assets', COALESCE(fs.checking, 0) + COALESCE(fs.savings, 0) +
+                    COALESCE(fs.investments, 0) + COALESCE(fs.real_estate, 0),
+                'total_liabilities', COALESCE(fs.credit_cards, 0) + COALESCE(fs.loans, 0) +
+                    COALESCE(fs.mortgage, 0) + COALESCE(fs.other_debt, 0),
+                'loan_count', COUNT(la.loan_id),
+                'total_loan_amount', COALESCE(SUM(la.loan_amount), 0)
+            ) as payload
             FROM customers c
             LEFT JOIN credit_histories ch ON c.customer_id = ch.customer_id
             LEFT JOIN financial_statements fs ON c.customer_id = fs.customer_id
@@ -334,27 +423,18 @@ class CustomerDatabaseTool(BaseDatabaseTool):
         result = self.execute_query(query, (customer_id,), fetch_one=True)
         
         if result.success and result.data:
-            # Calculate derived fields
-            total_assets = (
-                float(result.data.get('checking', 0) or 0) +
-                float(result.data.get('savings', 0) or 0) +
-                float(result.data.get('investments', 0) or 0) +
-                float(result.data.get('real_estate', 0) or 0)
-            )
+            summary = json.loads(result.data['payload'])
             
-            total_liabilities = (
-                float(result.data.get('credit_cards', 0) or 0) +
-                float(result.data.get('loans', 0) or 0) +
-                float(result.data.get('mortgage', 0) or 0) +
-                float(result.data.get('other_debt', 0) or 0)
-            )
+            # Totals are summed in SQL; derive net worth from them
+            total_assets = float(summary.get('total_assets') or 0)
+            total_liabilities = float(summary.get('total_liabilities') or 0)
             
-            if result.data is not None:
-                result.data.update({
-                    'total_assets': total_assets,
-                    'total_liabilities': total_liabilities,
-                    'net_worth': total_assets - total_liabilities
-                })
+            summary.update({
+                'total_assets': total_assets,
+                'total_liabilities': total_liabilities,
+                'net_worth': total_assets - total_liabilities
+            })
+            result.data = summary
         
         return result
     
@@ -412,17 +492,26 @@ class MarketDatabaseTool(BaseDatabaseTool):
     def get_historical_market_data(self, start_date: str, end_date: str, 
                                  indicators: Optional[List[str]] = None) -> DatabaseResult:
         """Get historical market data"""
-        self.logger.info(f"Fetching historical market data from {start_date} to {end_date}")
+        self.logger.info("Fetching historical market data from %s to %s", start_date, end_date)
         
         if indicators:
-            # Build dynamic query based on requested indicators
-            indicator_list = ', '.join(indicators)
-            query = f"""
-                SELECT date, {indicator_list}
-                FROM market_data 
-                WHERE date BETWEEN %s AND %s
-                ORDER BY date
-            """
+            # Only whitelisted columns may be interpolated into the query
+            market_columns = self._get_market_columns()
+            if market_columns is None:
+                return DatabaseResult(
+                    success=False,
+                    error="Unable to load market data columns"
+                )
+            
+            invalid = set(indicators) - market_columns
+            if invalid:
+                return DatabaseResult(
+                    success=False,
+                    error=f"Invalid market indicators: {', '.join(sorted(invalid))}"
+                )
+            
+            # Sorted order keeps the set of distinct query texts small
+            query = _historical_market_query(tuple(sorted(set(indicators))))
         else:
             query = """
                 SELECT *
@@ -433,11 +522,30 @@ class MarketDatabaseTool(BaseDatabaseTool):
         
         return self.execute_query(query, (start_date, end_date), fetch_all=True)
     
+    def _get_market_columns(self) -> Optional[frozenset]:
+        """Get the cached set of market_data column names"""
+        global _MARKET_COLUMNS
+        
+        if _MARKET_COLUMNS is None:
+            result = self.execute_query(
+                """
+                    SELECT COLUMN_NAME as column_name
+                    FROM information_schema.columns
+                    WHERE table_schema = DATABASE() AND table_name = 'market_data'
+                """,
+                fetch_all=True
+            )
+            if not result.success or not result.data:
+                return None
+            _MARKET_COLUMNS = frozenset(row['column_name'] for row in result.data)
+        
+        return _MARKET_COLUMNS
+    
     def calculate_risk_benchmark(self, loan_type: str, risk_score: int, 
                                loan_amount: float, term_months: int,
                                collateral_value: Optional[float] = None) -> DatabaseResult:
         """Calculate risk-adjusted benchmark rates"""
-        self.logger.info(f"Calculating risk benchmark for {loan_type} loan")
+        self.logger.info("Calculating risk benchmark for %s loan", loan_type)
         
         # Get current market rates
         market_query = """
@@ -515,7 +623,7 @@ class MarketDatabaseTool(BaseDatabaseTool):
     
     def analyze_economic_cycle(self, analysis_period: str = "12m") -> DatabaseResult:
         """Analyze current economic cycle"""
-        self.logger.info(f"Analyzing economic cycle for period: {analysis_period}")
+        self.logger.info("Analyzing economic cycle for period: %s", analysis_period)
         
         # Calculate months to look back
         months = 12 if analysis_period == "12m" else 6
@@ -568,7 +676,7 @@ class DatabaseToolManager:
     
     def get_customer_with_market_context(self, customer_id: str) -> DatabaseResult:
         """Get customer data with market context"""
-        self.logger.info(f"Getting customer {customer_id} with market context")
+        self.logger.info("Getting customer %s with market context", customer_id)
         
         # Get customer data
         customer_result = self.customer_tool.get_customer(customer_id)
@@ -596,7 +704,7 @@ class DatabaseToolManager:
     def calculate_loan_terms(self, customer_id: str, loan_type: str, 
                            loan_amount: float, term_months: int) -> DatabaseResult:
         """Calculate loan terms with customer and market data"""
-        self.logger.info(f"Calculating loan terms for customer {customer_id}")
+        self.logger.info("Calculating loan terms for customer %s", customer_id)
         
         # Get customer financial summary
         financial_result = self.customer_tool.get_financial_summary(customer_id)
@@ -637,11 +745,11 @@ def create_database_config(**kwargs) -> DatabaseConfig:
 def validate_database_result(result: DatabaseResult, operation: str) -> bool:
     """Validate database operation result"""
     if not result.success:
-        logger.error(f"Database operation failed: {operation} - {result.error}")
+        logger.error("Database operation failed: %s - %s", operation, result.error)
         return False
     
     if not result.data:
-        logger.warning(f"Database operation returned no data: {operation}")
+        logger.warning("Database operation returned no data: %s", operation)
         return False
     
     return True
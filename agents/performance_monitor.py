@@ -17,6 +17,12 @@ from concurrent.futures import ThreadPoolExecutor, as_completed
 import statistics
 import psutil
 import os
+import sys
+from array import array
+from bisect import bisect_left, bisect_right
+from operator import attrgetter, itemgetter
+from collections import Counter, deque
+import numpy as np
 
 # Configure logging
 logging.basicConfig(
@@ -35,7 +41,7 @@ class MetricType(Enum):
     ERROR_RATE = "error_rate"
     SUCCESS_RATE = "success_rate"
 
-@dataclass
+@dataclass(slots=True)
 class PerformanceMetric:
     """Individual performance metric"""
     metric_type: MetricType
@@ -44,14 +50,14 @@ class PerformanceMetric:
     metadata: Dict[str, Any] = field(default_factory=dict)
     unit: str = ""
 
-@dataclass
+@dataclass(slots=True)
 class PerformanceSnapshot:
     """Performance snapshot at a point in time"""
     timestamp: datetime
     metrics: Dict[MetricType, PerformanceMetric]
     system_info: Dict[str, Any] = field(default_factory=dict)
 
-@dataclass
+@dataclass(slots=True)
 class PerformanceReport:
     """Comprehensive performance report"""
     start_time: datetime
@@ -67,23 +73,292 @@ class PerformanceReport:
     recommendations: List[str] = field(default_factory=list)
     detailed_metrics: Dict[str, Any] = field(default_factory=dict)
 
+class _MetricColumns:
+    """Bounded columnar (structure-of-arrays) store for one metric type"""
+    
+    __slots__ = ("capacity", "timestamps", "values", "success", "labels")
+    
+    def __init__(self, capacity: int):
+        self.capacity = capacity
+        self.timestamps = array("d")  # monitor clock offsets in seconds, kept sorted
+        self.values = array("d")
+        self.success = array("B")
+        self.labels = array("H")  # interned query/agent type ids, 0 when unlabeled
+    
+    def __len__(self) -> int:
+        return len(self.timestamps)
+    
+    def extend(self, rows: List[tuple]):
+        """Append (timestamp, value, success, label) rows, evicting the oldest beyond capacity"""
+        if not rows:
+            return
+        rows = sorted(rows)
+        
+        # Rows merged from another thread may predate the newest stored rows;
+        # re-merge the overlapping tail so timestamps stay sorted
+        start = bisect_right(self.timestamps, rows[0][0])
+        if start < len(self.timestamps):
+            tail = list(zip(self.timestamps[start:], self.values[start:], self.success[start:], self.labels[start:]))
+            del self.timestamps[start:], self.values[start:], self.success[start:], self.labels[start:]
+            rows = sorted(tail + rows)
+        
+        for timestamp, value, success, label in rows:
+            self.timestamps.append(timestamp)
+            self.values.append(value)
+            self.success.append(success)
+            self.labels.append(label)
+        
+        # Evict in chunks so trimming stays amortized O(1) per row
+        overflow = len(self.timestamps) - self.capacity
+        if overflow > self.capacity // 4:
+            del self.timestamps[:overflow], self.values[:overflow], self.success[:overflow], self.labels[:overflow]
+    
+    def window(self, start_ts: float, end_ts: float) -> tuple:
+        """Copy the values, success flags and labels recorded within [start_ts, end_ts]"""
+        timestamps = np.frombuffer(self.timestamps, dtype=np.float64)
+        lo = int(np.searchsorted(timestamps, start_ts, side="left"))
+        hi = int(np.searchsorted(timestamps, end_ts, side="right"))
+        # The buffer export must be released before the arrays can grow again
+        del timestamps
+        return (np.array(self.values[lo:hi], dtype=np.float64),
+                np.array(self.success[lo:hi], dtype=np.bool_),
+                np.array(self.labels[lo:hi], dtype=np.intp))
+
+class _RunningTotals:
+    """Running aggregates for a span of recorded metrics"""
+    
+    __slots__ = ("exec_count", "exec_success", "exec_sum", "exec_mean", "exec_m2",
+                 "db_count", "agent_count")
+    
+    def __init__(self):
+        self.exec_count = 0
+        self.exec_success = 0
+        self.exec_sum = 0.0
+        self.exec_mean = 0.0
+        self.exec_m2 = 0.0  # Welford sum of squared deviations
+        self.db_count = 0
+        self.agent_count = 0
+    
+    def record_execution(self, execution_time: float, success: bool):
+        """Add one execution sample"""
+        self.exec_count += 1
+        self.exec_success += bool(success)
+        self.exec_sum += execution_time
+        delta = execution_time - self.exec_mean
+        self.exec_mean += delta / self.exec_count
+        self.exec_m2 += delta * (execution_time - self.exec_mean)
+    
+    def add(self, other: "_RunningTotals"):
+        """Fold another set of totals into this one"""
+        if other.exec_count:
+            # Chan et al. parallel variance combination
+            count = self.exec_count + other.exec_count
+            delta = other.exec_mean - self.exec_mean
+            self.exec_mean += delta * other.exec_count / count
+            self.exec_m2 += other.exec_m2 + delta * delta * self.exec_count * other.exec_count / count
+            self.exec_count = count
+        self.exec_success += other.exec_success
+        self.exec_sum += other.exec_sum
+        self.db_count += other.db_count
+        self.agent_count += other.agent_count
+    
+    def exec_stdev(self) -> float:
+        """Sample standard deviation of execution times"""
+        return (self.exec_m2 / (self.exec_count - 1)) ** 0.5 if self.exec_count > 1 else 0.0
+
+# Metric types recorded through record_* and stored column-wise
+_RECORDED_TYPES = (MetricType.EXECUTION_TIME, MetricType.DATABASE_QUERIES, MetricType.AGENT_INTERACTIONS)
+
+def _to_epoch(moment: datetime) -> float:
+    """Convert a datetime to float epoch seconds"""
+    return moment.timestamp()
+
+# Sort keys for bisecting pending rows and snapshots, both appended in time order
+_row_timestamp = itemgetter(0)
+_snapshot_timestamp = attrgetter("timestamp")
+
+class _LocalStats:
+    """Per-thread pending rows and totals, folded into the shared ones by the owning thread"""
+    
+    __slots__ = ("thread", "totals", "rows", "error_counts", "pending", "last_merge")
+    
+    def __init__(self):
+        self.thread = threading.current_thread()
+        self.clear()
+    
+    def clear(self):
+        """Start a fresh accumulation period"""
+        self.totals = _RunningTotals()
+        self.rows: Dict[MetricType, List[tuple]] = {metric_type: [] for metric_type in _RECORDED_TYPES}
+        self.error_counts: Counter = Counter()
+        self.pending = 0
+        self.last_merge = time.monotonic()
+
+class _AdaptiveInterval:
+    """Sampling interval that backs off while CPU usage is steady
+    
+    Tracks an exponential moving average and variance of CPU usage. Any
+    warning threshold crossing drops to the minimum interval, a steady
+    signal doubles the interval up to the maximum, and anything else
+    returns to the base interval.
+    """
+    
+    __slots__ = ("base", "minimum", "maximum", "epsilon", "alpha", "current", "cpu_ema", "cpu_var")
+    
+    def __init__(self, base: float = 5.0, minimum: float = 1.0, maximum: float = 30.0,
+                 epsilon: float = 4.0, alpha: float = 0.3):
+        self.base = base
+        self.minimum = minimum
+        self.maximum = maximum
+        self.epsilon = epsilon  # CPU variance (%^2) treated as steady
+        self.alpha = alpha
+        self.current = base
+        self.cpu_ema: Optional[float] = None
+        self.cpu_var = 0.0
+    
+    def update(self, snapshot: PerformanceSnapshot, cpu_warn: float, mem_warn: float) -> float:
+        """Fold a snapshot into the CPU statistics and return the next interval"""
+        cpu = snapshot.metrics.get(MetricType.CPU_USAGE)
+        memory = snapshot.metrics.get(MetricType.MEMORY_USAGE)
+        if cpu is None:
+            self.current = self.base
+            return self.current
+        
+        if self.cpu_ema is None:
+            self.cpu_ema = cpu.value
+        else:
+            delta = cpu.value - self.cpu_ema
+            self.cpu_ema += self.alpha * delta
+            self.cpu_var = (1 - self.alpha) * (self.cpu_var + self.alpha * delta * delta)
+        
+        if cpu.value >= cpu_warn or (memory is not None and memory.value >= mem_warn):
+            self.current = self.minimum
+        elif self.cpu_var < self.epsilon:
+            self.current = min(max(self.current, self.base) * 2, self.maximum)
+        else:
+            self.current = self.base
+        return self.current
+
+class _SystemSampler:
+    """Background system sampler shared by every monitor in the process
+    
+    One thread collects a snapshot per interval and fans it out to the
+    registered monitors, so psutil is read once regardless of monitor count.
+    """
+    
+    def __init__(self, interval: float = 5.0):
+        self.interval = interval
+        self.pacing = _AdaptiveInterval(base=interval)
+        self.listeners: List["PerformanceMonitor"] = []
+        self.lock = threading.Lock()
+        self.thread: Optional[threading.Thread] = None
+        self.stop_event = threading.Event()
+    
+    def register(self, monitor: "PerformanceMonitor") -> threading.Thread:
+        """Add a monitor, starting the sampler thread if needed"""
+        with self.lock:
+            if monitor not in self.listeners:
+                self.listeners.append(monitor)
+            if self.thread is None or not self.thread.is_alive():
+                self.stop_event = threading.Event()
+                self.thread = threading.Thread(target=self._run, args=(self.stop_event,),
+                                               name="performance-sampler", daemon=True)
+                self.thread.start()
+            return self.thread
+    
+    def unregister(self, monitor: "PerformanceMonitor"):
+        """Remove a monitor, stopping the sampler thread after the last one"""
+        with self.lock:
+            if monitor in self.listeners:
+                self.listeners.remove(monitor)
+            if self.listeners or self.thread is None:
+                return
+            self.stop_event.set()
+            thread, self.thread = self.thread, None
+        
+        if thread is not threading.current_thread():
+            thread.join(timeout=5)
+    
+    def _run(self, stop_event: threading.Event):
+        """Sampling loop"""
+        while not stop_event.is_set():
+            with self.lock:
+                listeners = list(self.listeners)
+            if not listeners:
+                break
+            
+            wait = self.interval
+            try:
+                collector = listeners[0]
+                snapshot = collector._collect_system_snapshot()
+                for monitor in listeners:
+                    monitor._last_system = collector._last_system
+                    monitor._ingest_snapshot(snapshot)
+                wait = self.pacing.update(snapshot, collector._cpu_warn, collector._mem_warn)
+            except Exception as e:
+                logger.error("Error in system monitoring loop: %s", e)
+                wait = self.interval * 2  # Wait longer on error
+            
+            stop_event.wait(wait)
+
 class PerformanceMonitor:
     """Performance monitoring and optimization for CrewAI"""
     
-    def __init__(self, enable_system_monitoring: bool = True):
-        """Initialize performance monitor"""
+    # Shared by all instances started with start_monitoring()
+    _GLOBAL_SAMPLER = _SystemSampler()
+    
+    def __init__(self, enable_system_monitoring: bool = True,
+                 history_capacity: int = 100_000, snapshot_capacity: int = 10_000):
+        """Initialize performance monitor
+        
+        history_capacity bounds the samples kept per metric type and
+        snapshot_capacity the system snapshots; the oldest are evicted first.
+        """
         self.logger = logger
         self.enable_system_monitoring = enable_system_monitoring
         
-        # Metrics storage
-        self.metrics_history: List[PerformanceMetric] = []
-        self.snapshots: List[PerformanceSnapshot] = []
-        self.execution_times: List[float] = []
-        self.error_counts: Dict[str, int] = {}
+        # Metrics storage: one bounded column store per metric type
+        self.columns: Dict[MetricType, _MetricColumns] = {
+            metric_type: _MetricColumns(history_capacity)
+            for metric_type in _RECORDED_TYPES + (MetricType.MEMORY_USAGE, MetricType.CPU_USAGE)
+        }
+        self.snapshots: deque = deque(maxlen=snapshot_capacity)
+        self.error_counts: Counter = Counter()
+        
+        # Columns, session totals and error counts are guarded by _agg_lock.
+        # Recording threads accumulate into thread-local stats without locking
+        # and fold them in at most once per merge interval.
+        self._agg_lock = threading.Lock()
+        self._totals = _RunningTotals()
+        
+        # Samples are timestamped with monotonic offsets from this origin;
+        # wall-clock times are only converted at report time
+        self._start_epoch = time.time()
+        self._start_mono = time.monotonic()
+        self._tls = threading.local()
+        # Query/agent type names interned to small ids stored in the label column
+        self._label_ids: Dict[str, int] = {}
+        self._label_names: List[str] = [""]
+        self._local_stats: List[_LocalStats] = []
+        self._merge_interval = 1.0  # seconds
+        # Rows per thread before a merge; 64 row tuples are roughly one 4 KiB page
+        self._batch_size = 64
+        
+        # Process constants sampled once instead of on every snapshot
+        self._pid = os.getpid()
+        self._cpu_count = psutil.cpu_count()
+        self._proc = psutil.Process(self._pid)
+        self._gb = 1 / (1024**3)
+        
+        # Latest (monotonic time, cpu percent, virtual memory) sample, replaced
+        # as one tuple so readers never see a torn update
+        self._last_system = (float("-inf"), 0.0, None)
+        psutil.cpu_percent(interval=None)  # prime non-blocking CPU reads
         
         # Monitoring state
         self.is_monitoring = False
         self.monitor_thread = None
+        self._monitor_task: Optional[asyncio.Task] = None
         self.start_time = None
         
         # Performance thresholds
@@ -98,6 +373,39 @@ class PerformanceMonitor:
             "error_rate_critical": 15.0  # percentage
         }
         
+        # Alert thresholds resolved once; system alert level is 0 (ok), 1 (warning) or 2 (critical)
+        self._exec_warn = self.thresholds["execution_time_warning"]
+        self._exec_crit = self.thresholds["execution_time_critical"]
+        self._mem_warn = self.thresholds["memory_usage_warning"]
+        self._mem_crit = self.thresholds["memory_usage_critical"]
+        self._cpu_warn = self.thresholds["cpu_usage_warning"]
+        self._cpu_crit = self.thresholds["cpu_usage_critical"]
+        self._alert_rules = (
+            (MetricType.MEMORY_USAGE, self._mem_warn, self._mem_crit,
+             (None, "High memory usage: %s%%", "Critical memory usage: %s%%")),
+            (MetricType.CPU_USAGE, self._cpu_warn, self._cpu_crit,
+             (None, "High CPU usage: %s%%", "Critical CPU usage: %s%%")),
+        )
+        self._alert_levels = (None, logging.WARNING, logging.CRITICAL)
+        
+        # Recommendation rules: (measure, warning, critical, warning message, critical message)
+        self._recommendation_rules = (
+            ("error_rate", self.thresholds["error_rate_warning"], self.thresholds["error_rate_critical"],
+             "Warning: Elevated error rate. Monitor system health and review recent changes.",
+             "Critical: High error rate detected. Review error handling and system stability."),
+            ("execution_time", self._exec_warn, self._exec_crit,
+             "Warning: Slow execution times. Review performance bottlenecks in data processing.",
+             "Critical: Very slow execution times. Consider optimizing database queries and agent interactions."),
+            ("memory_usage", self._mem_warn, self._mem_crit,
+             "Warning: High memory usage. Monitor memory leaks and optimize data structures.",
+             "Critical: Very high memory usage. Consider implementing memory management and cleanup."),
+            ("cpu_usage", self._cpu_warn, self._cpu_crit,
+             "Warning: High CPU usage. Review computational efficiency and consider parallelization.",
+             "Critical: Very high CPU usage. Consider scaling horizontally or optimizing algorithms."),
+        )
+        self._alert_interval = 60.0  # seconds between identical alerts
+        self._last_alert_ts: Dict[tuple, float] = {}
+        
         self.logger.info("Performance monitor initialized")
     
     def start_monitoring(self):
@@ -110,11 +418,29 @@ class PerformanceMonitor:
         self.start_time = datetime.now()
         
         if self.enable_system_monitoring:
-            self.monitor_thread = threading.Thread(target=self._system_monitoring_loop, daemon=True)
-            self.monitor_thread.start()
+            self.monitor_thread = PerformanceMonitor._GLOBAL_SAMPLER.register(self)
         
         self.logger.info("Performance monitoring started")
     
+    async def start_monitoring_async(self):
+        """Start performance monitoring as a task on the running event loop
+        
+        Use this instead of start_monitoring() inside asyncio applications:
+        sampling runs on the loop without a dedicated thread or blocking CPU
+        reads. uvloop is the recommended event loop for such hosts.
+        """
+        if self.is_monitoring:
+            self.logger.warning("Performance monitoring already active")
+            return
+        
+        self.is_monitoring = True
+        self.start_time = datetime.now()
+        
+        if self.enable_system_monitoring:
+            self._monitor_task = asyncio.ensure_future(self._system_monitoring_loop_async())
+        
+        self.logger.info("Performance monitoring started (asyncio)")
+    
     def stop_monitoring(self):
         """Stop performance monitoring"""
         if not self.is_monitoring:
@@ -123,198 +449,310 @@ class PerformanceMonitor:
         
         self.is_monitoring = False
         
-        if self.monitor_thread and self.monitor_thread.is_alive():
-            self.monitor_thread.join(timeout=5)
+        if self.monitor_thread is not None:
+            PerformanceMonitor._GLOBAL_SAMPLER.unregister(self)
+            self.monitor_thread = None
+        
+        if self._monitor_task and not self._monitor_task.done():
+            self._monitor_task.cancel()
+        self._monitor_task = None
+        
+        self.flush()
         
         self.logger.info("Performance monitoring stopped")
     
-    def _system_monitoring_loop(self):
-        """System monitoring loop"""
+    def _ingest_snapshot(self, snapshot: PerformanceSnapshot):
+        """Store and check one system snapshot"""
+        self.snapshots.append(snapshot)
+        self._aggregate_snapshot(snapshot)
+        self._merge_finished_threads()
+        
+        # Check for critical conditions
+        self._check_performance_alerts(snapshot)
+    
+    async def _system_monitoring_loop_async(self):
+        """System monitoring loop for asyncio hosts"""
+        # Prime the CPU counter; later non-blocking reads cover the time since the previous read
+        psutil.cpu_percent(interval=None)
+        pacing = _AdaptiveInterval()
+        
         while self.is_monitoring:
             try:
-                # Collect system metrics
-                snapshot = self._collect_system_snapshot()
-                self.snapshots.append(snapshot)
-                
-                # Check for critical conditions
-                self._check_performance_alerts(snapshot)
-                
-                # Wait before next collection
-                time.sleep(5)  # Collect every 5 seconds
+                await asyncio.sleep(pacing.current)
+                snapshot = self._collect_system_snapshot(cpu_interval=None)
+                self._ingest_snapshot(snapshot)
+                pacing.update(snapshot, self._cpu_warn, self._mem_warn)
                 
             except Exception as e:
-                self.logger.error(f"Error in system monitoring loop: {str(e)}")
-                time.sleep(10)  # Wait longer on error
+                self.logger.error("Error in system monitoring loop: %s", e)
+                await asyncio.sleep(10)  # Wait longer on error
     
-    def _collect_system_snapshot(self) -> PerformanceSnapshot:
-        """Collect system performance snapshot"""
+    def _collect_system_snapshot(self, cpu_interval: Optional[float] = 1) -> PerformanceSnapshot:
+        """Collect system performance snapshot
+        
+        cpu_interval is passed to psutil.cpu_percent; None reads usage since
+        the previous call without blocking.
+        """
         try:
             # Get system metrics
             memory = psutil.virtual_memory()
-            cpu_percent = psutil.cpu_percent(interval=1)
+            cpu_percent = psutil.cpu_percent(interval=cpu_interval)
+            self._last_system = (time.monotonic(), cpu_percent, memory)
+            now = datetime.now()
+            gb = self._gb
             
             # Create metrics
             metrics = {
                 MetricType.MEMORY_USAGE: PerformanceMetric(
                     metric_type=MetricType.MEMORY_USAGE,
                     value=memory.percent,
-                    timestamp=datetime.now(),
-                    unit="%",
-                    metadata={"total_gb": memory.total / (1024**3), "available_gb": memory.available / (1024**3)}
+                    timestamp=now,
+                    unit="%"
                 ),
                 MetricType.CPU_USAGE: PerformanceMetric(
                     metric_type=MetricType.CPU_USAGE,
                     value=cpu_percent,
-                    timestamp=datetime.now(),
+                    timestamp=now,
                     unit="%"
                 )
             }
             
             # System info
             system_info = {
-                "memory_total_gb": memory.total / (1024**3),
-                "memory_available_gb": memory.available / (1024**3),
-                "memory_used_gb": memory.used / (1024**3),
-                "cpu_count": psutil.cpu_count(),
-                "process_id": os.getpid()
+                "memory_total_gb": memory.total * gb,
+                "memory_available_gb": memory.available * gb,
+                "memory_used_gb": memory.used * gb,
+                "process_memory_gb": self._proc.memory_info().rss * gb,
+                "cpu_count": self._cpu_count,
+                "process_id": self._pid
             }
             
             return PerformanceSnapshot(
-                timestamp=datetime.now(),
+                timestamp=now,
                 metrics=metrics,
                 system_info=system_info
             )
             
         except Exception as e:
-            self.logger.error(f"Error collecting system snapshot: {str(e)}")
+            self.logger.error("Error collecting system snapshot: %s", e)
             return PerformanceSnapshot(timestamp=datetime.now(), metrics={}, system_info={})
     
+    def _now(self) -> float:
+        """Monotonic seconds since the monitor was created"""
+        return time.monotonic() - self._start_mono
+    
+    def _offset(self, moment: datetime) -> float:
+        """Translate a wall-clock datetime to the monitor's monotonic offset"""
+        return _to_epoch(moment) - self._start_epoch
+    
+    def _label_id(self, name: str) -> int:
+        """Get the small integer id for a query or agent type name"""
+        label = self._label_ids.get(name)
+        if label is None:
+            with self._agg_lock:
+                label = self._label_ids.get(name)
+                if label is None:
+                    label = len(self._label_names)
+                    self._label_names.append(sys.intern(name))
+                    self._label_ids[self._label_names[label]] = label
+        return label
+    
+    def _label_counts(self, labels: np.ndarray) -> Dict[str, int]:
+        """Reverse-map a label column to per-name counts"""
+        counts = np.bincount(labels, minlength=len(self._label_names)) if labels.size else ()
+        return {self._label_names[label]: int(count) for label, count in enumerate(counts) if label and count}
+    
+    def _local(self) -> _LocalStats:
+        """Get the calling thread's pending stats, registering them on first use"""
+        stats = getattr(self._tls, "stats", None)
+        if stats is None:
+            stats = self._tls.stats = _LocalStats()
+            with self._agg_lock:
+                self._local_stats.append(stats)
+        return stats
+    
+    def _merge_local(self, stats: _LocalStats):
+        """Fold a thread's pending stats into the shared aggregates (caller holds _agg_lock)"""
+        self._totals.add(stats.totals)
+        for metric_type, rows in stats.rows.items():
+            self.columns[metric_type].extend(rows)
+        self.error_counts.update(stats.error_counts)
+        stats.clear()
+    
+    def _maybe_merge(self, stats: _LocalStats):
+        """Count a recorded row and merge once a full batch or the merge interval has accumulated"""
+        stats.pending += 1
+        if stats.pending >= self._batch_size or time.monotonic() - stats.last_merge >= self._merge_interval:
+            with self._agg_lock:
+                self._merge_local(stats)
+    
+    def flush(self):
+        """Merge the calling thread's pending batch and those of exited threads
+        
+        Batches of other live threads are merged by their owners and are
+        already included in reports while pending.
+        """
+        stats = getattr(self._tls, "stats", None)
+        if stats is not None:
+            with self._agg_lock:
+                self._merge_local(stats)
+        self._merge_finished_threads()
+    
+    def _merge_finished_threads(self):
+        """Merge and drop the pending stats of threads that have exited"""
+        with self._agg_lock:
+            finished = [stats for stats in self._local_stats if not stats.thread.is_alive()]
+            for stats in finished:
+                self._merge_local(stats)
+                self._local_stats.remove(stats)
+    
+    def _aggregate_snapshot(self, snapshot: PerformanceSnapshot):
+        """Fold system snapshot values into the running aggregates"""
+        memory = snapshot.metrics.get(MetricType.MEMORY_USAGE)
+        cpu = snapshot.metrics.get(MetricType.CPU_USAGE)
+        
+        timestamp = self._now()
+        
+        with self._agg_lock:
+            if memory is not None:
+                self.columns[MetricType.MEMORY_USAGE].extend([(timestamp, memory.value, True, 0)])
+            if cpu is not None:
+                self.columns[MetricType.CPU_USAGE].extend([(timestamp, cpu.value, True, 0)])
+    
     def _check_performance_alerts(self, snapshot: PerformanceSnapshot):
         """Check for performance alerts"""
         try:
-            for metric_type, metric in snapshot.metrics.items():
-                if metric_type == MetricType.MEMORY_USAGE:
-                    if metric.value >= self.thresholds["memory_usage_critical"]:
-                        self.logger.critical(f"Critical memory usage: {metric.value}%")
-                    elif metric.value >= self.thresholds["memory_usage_warning"]:
-                        self.logger.warning(f"High memory usage: {metric.value}%")
+            if not self.logger.isEnabledFor(logging.WARNING):
+                return
+            
+            now = time.monotonic()
+            for metric_type, warn, crit, messages in self._alert_rules:
+                metric = snapshot.metrics.get(metric_type)
+                if metric is None:
+                    continue
                 
-                elif metric_type == MetricType.CPU_USAGE:
-                    if metric.value >= self.thresholds["cpu_usage_critical"]:
-                        self.logger.critical(f"Critical CPU usage: {metric.value}%")
-                    elif metric.value >= self.thresholds["cpu_usage_warning"]:
-                        self.logger.warning(f"High CPU usage: {metric.value}%")
+                value = metric.value
+                level = (value >= warn) + (value >= crit)
+                if not level:
+                    continue
+                
+                # Identical alerts are logged at most once per alert interval
+                key = (metric_type, level)
+                if now - self._last_alert_ts.get(key, -self._alert_interval) < self._alert_interval:
+                    continue
+                self._last_alert_ts[key] = now
+                self.logger.log(self._alert_levels[level], messages[level], value)
                         
         except Exception as e:
-            self.logger.error(f"Error checking performance alerts: {str(e)}")
+            self.logger.error("Error checking performance alerts: %s", e)
     
     def record_execution(self, execution_time: float, success: bool, 
                         customer_id: Optional[str] = None, error_type: Optional[str] = None):
         """Record execution metrics"""
         try:
-            # Record execution time
-            self.execution_times.append(execution_time)
+            stats = self._local()
             
             # Record error if applicable
             if not success and error_type:
-                self.error_counts[error_type] = self.error_counts.get(error_type, 0) + 1
+                stats.error_counts[error_type] += 1
             
-            # Create execution metric
-            metric = PerformanceMetric(
-                metric_type=MetricType.EXECUTION_TIME,
-                value=execution_time,
-                timestamp=datetime.now(),
-                unit="seconds",
-                metadata={
-                    "success": success,
-                    "customer_id": customer_id,
-                    "error_type": error_type
-                }
-            )
-            
-            self.metrics_history.append(metric)
+            stats.rows[MetricType.EXECUTION_TIME].append((self._now(), execution_time, bool(success), 0))
+            stats.totals.record_execution(execution_time, success)
+            self._maybe_merge(stats)
             
             # Check for performance alerts
-            if execution_time >= self.thresholds["execution_time_critical"]:
-                self.logger.critical(f"Critical execution time: {execution_time}s for customer {customer_id}")
-            elif execution_time >= self.thresholds["execution_time_warning"]:
-                self.logger.warning(f"Slow execution time: {execution_time}s for customer {customer_id}")
+            if execution_time >= self._exec_crit:
+                self.logger.critical("Critical execution time: %ss for customer %s", execution_time, customer_id)
+            elif execution_time >= self._exec_warn:
+                self.logger.warning("Slow execution time: %ss for customer %s", execution_time, customer_id)
                 
         except Exception as e:
-            self.logger.error(f"Error recording execution: {str(e)}")
+            self.logger.error("Error recording execution: %s", e)
     
     def record_database_query(self, query_type: str, execution_time: float, success: bool):
         """Record database query metrics"""
         try:
-            metric = PerformanceMetric(
-                metric_type=MetricType.DATABASE_QUERIES,
-                value=execution_time,
-                timestamp=datetime.now(),
-                unit="seconds",
-                metadata={
-                    "query_type": query_type,
-                    "success": success
-                }
-            )
-            
-            self.metrics_history.append(metric)
+            stats = self._local()
+            label = self._label_id(query_type)
+            stats.rows[MetricType.DATABASE_QUERIES].append((self._now(), execution_time, bool(success), label))
+            stats.totals.db_count += 1
+            self._maybe_merge(stats)
             
         except Exception as e:
-            self.logger.error(f"Error recording database query: {str(e)}")
+            self.logger.error("Error recording database query: %s", e)
     
     def record_agent_interaction(self, agent_type: str, interaction_time: float, success: bool):
         """Record agent interaction metrics"""
         try:
-            metric = PerformanceMetric(
-                metric_type=MetricType.AGENT_INTERACTIONS,
-                value=interaction_time,
-                timestamp=datetime.now(),
-                unit="seconds",
-                metadata={
-                    "agent_type": agent_type,
-                    "success": success
-                }
-            )
-            
-            self.metrics_history.append(metric)
+            stats = self._local()
+            label = self._label_id(agent_type)
+            stats.rows[MetricType.AGENT_INTERACTIONS].append((self._now(), interaction_time, bool(success), label))
+            stats.totals.agent_count += 1
+            self._maybe_merge(stats)
             
         except Exception as e:
-            self.logger.error(f"Error recording agent interaction: {str(e)}")
+            self.logger.error("Error recording agent interaction: %s", e)
+    
+    def _window(self, metric_type: MetricType, start_ts: float, end_ts: float,
+                pending: List[_LocalStats]) -> tuple:
+        """Get (values, success, labels) arrays for a metric type within a time window (caller holds _agg_lock)"""
+        values, success, labels = self.columns[metric_type].window(start_ts, end_ts)
+        
+        # Rows still pending in live threads; each thread's rows are in time order
+        extra = []
+        for stats in pending:
+            rows = stats.rows.get(metric_type, ())
+            lo = bisect_left(rows, start_ts, key=_row_timestamp)
+            hi = bisect_right(rows, end_ts, lo=lo, key=_row_timestamp)
+            extra.extend(rows[lo:hi])
+        if extra:
+            values = np.concatenate((values, np.fromiter((row[1] for row in extra), dtype=np.float64, count=len(extra))))
+            success = np.concatenate((success, np.fromiter((row[2] for row in extra), dtype=np.bool_, count=len(extra))))
+            labels = np.concatenate((labels, np.fromiter((row[3] for row in extra), dtype=np.intp, count=len(extra))))
+        
+        return values, success, labels
     
     def get_performance_report(self, start_time: Optional[datetime] = None, 
                              end_time: Optional[datetime] = None) -> PerformanceReport:
         """Generate comprehensive performance report"""
         try:
-            # Set time range
+            # Set time range; the window is compared as float offsets from here on
             if not start_time:
                 start_time = self.start_time or datetime.now() - timedelta(hours=1)
             if not end_time:
                 end_time = datetime.now()
             
-            # Filter metrics by time range
-            filtered_metrics = [
-                m for m in self.metrics_history
-                if start_time <= m.timestamp <= end_time
-            ]
+            start_ts = self._offset(start_time)
+            end_ts = self._offset(end_time)
+            snapshot_start = bisect_left(self.snapshots, start_time, key=_snapshot_timestamp)
+            snapshot_end = bisect_right(self.snapshots, end_time, key=_snapshot_timestamp)
             
-            # Calculate statistics
-            execution_metrics = [m for m in filtered_metrics if m.metric_type == MetricType.EXECUTION_TIME]
-            memory_metrics = [m for m in filtered_metrics if m.metric_type == MetricType.MEMORY_USAGE]
-            cpu_metrics = [m for m in filtered_metrics if m.metric_type == MetricType.CPU_USAGE]
+            self._merge_finished_threads()
+            with self._agg_lock:
+                pending = list(self._local_stats)
+                exec_values, exec_success, _ = self._window(MetricType.EXECUTION_TIME, start_ts, end_ts, pending)
+                db_values, _, db_labels = self._window(MetricType.DATABASE_QUERIES, start_ts, end_ts, pending)
+                agent_values, _, agent_labels = self._window(MetricType.AGENT_INTERACTIONS, start_ts, end_ts, pending)
+                memory_values, _, _ = self._window(MetricType.MEMORY_USAGE, start_ts, end_ts, pending)
+                cpu_values, _, _ = self._window(MetricType.CPU_USAGE, start_ts, end_ts, pending)
+                
+                error_counts = self.error_counts.copy()
+                for stats in pending:
+                    error_counts.update(dict(stats.error_counts))
             
             # Calculate totals
-            total_executions = len(execution_metrics)
-            successful_executions = len([m for m in execution_metrics if m.metadata.get("success", False)])
+            total_executions = int(exec_values.size)
+            successful_executions = int(exec_success.sum())
             failed_executions = total_executions - successful_executions
             
-            # Calculate averages
-            average_execution_time = statistics.mean([m.value for m in execution_metrics]) if execution_metrics else 0
-            average_cpu_usage = statistics.mean([m.value for m in cpu_metrics]) if cpu_metrics else 0
-            peak_memory_usage = max([m.value for m in memory_metrics]) if memory_metrics else 0
+            # Calculate averages (vectorized reductions over the columns)
+            average_execution_time = float(exec_values.mean()) if exec_values.size else 0
+            average_cpu_usage = float(cpu_values.mean()) if cpu_values.size else 0
+            peak_memory_usage = float(memory_values.max()) if memory_values.size else 0
             
             # Count database queries and agent interactions
-            database_query_count = len([m for m in filtered_metrics if m.metric_type == MetricType.DATABASE_QUERIES])
-            agent_interaction_count = len([m for m in filtered_metrics if m.metric_type == MetricType.AGENT_INTERACTIONS])
+            database_query_count = int(db_values.size)
+            agent_interaction_count = int(agent_values.size)
             
             # Generate recommendations
             recommendations = self._generate_recommendations(
@@ -322,13 +760,25 @@ class PerformanceMonitor:
                 peak_memory_usage, average_cpu_usage
             )
             
-            # Detailed metrics
+            # Execution time percentiles in a single pass
+            if exec_values.size:
+                p50, p95, p99 = (float(p) for p in np.percentile(exec_values, (50, 95, 99)))
+            else:
+                p50 = p95 = p99 = 0.0
+            
+            # Detailed metrics; raw series are read-only views over the window arrays
             detailed_metrics = {
-                "execution_times": [m.value for m in execution_metrics],
-                "memory_usage": [m.value for m in memory_metrics],
-                "cpu_usage": [m.value for m in cpu_metrics],
-                "error_counts": self.error_counts.copy(),
-                "recent_snapshots": len([s for s in self.snapshots if start_time <= s.timestamp <= end_time])
+                "execution_times": memoryview(exec_values).toreadonly(),
+                "execution_time_stdev": float(exec_values.std(ddof=1)) if exec_values.size > 1 else 0.0,
+                "execution_times_p50": p50,
+                "execution_times_p95": p95,
+                "execution_times_p99": p99,
+                "memory_usage": memoryview(memory_values).toreadonly(),
+                "cpu_usage": memoryview(cpu_values).toreadonly(),
+                "error_counts": dict(error_counts),
+                "query_types": self._label_counts(db_labels),
+                "agent_types": self._label_counts(agent_labels),
+                "recent_snapshots": snapshot_end - snapshot_start
             }
             
             return PerformanceReport(
@@ -347,7 +797,7 @@ class PerformanceMonitor:
             )
             
         except Exception as e:
-            self.logger.error(f"Error generating performance report: {str(e)}")
+            self.logger.error("Error generating performance report: %s", e)
             return PerformanceReport(
                 start_time=start_time or datetime.now(),
                 end_time=end_time or datetime.now(),
@@ -367,33 +817,23 @@ class PerformanceMonitor:
                                 average_execution_time: float, peak_memory_usage: float,
                                 average_cpu_usage: float) -> List[str]:
         """Generate performance optimization recommendations"""
-        recommendations = []
+        measures = {
+            # Error rate only applies once something has executed
+            "error_rate": (100 - successful_executions / total_executions * 100) if total_executions > 0 else None,
+            "execution_time": average_execution_time,
+            "memory_usage": peak_memory_usage,
+            "cpu_usage": average_cpu_usage
+        }
         
-        # Success rate recommendations
-        if total_executions > 0:
-            success_rate = (successful_executions / total_executions) * 100
-            if success_rate < (100 - self.thresholds["error_rate_critical"]):
-                recommendations.append("Critical: High error rate detected. Review error handling and system stability.")
-            elif success_rate < (100 - self.thresholds["error_rate_warning"]):
-                recommendations.append("Warning: Elevated error rate. Monitor system health and review recent changes.")
-        
-        # Execution time recommendations
-        if average_execution_time > self.thresholds["execution_time_critical"]:
-            recommendations.append("Critical: Very slow execution times. Consider optimizing database queries and agent interactions.")
-        elif average_execution_time > self.thresholds["execution_time_warning"]:
-            recommendations.append("Warning: Slow execution times. Review performance bottlenecks in data processing.")
-        
-        # Memory usage recommendations
-        if peak_memory_usage > self.thresholds["memory_usage_critical"]:
-            recommendations.append("Critical: Very high memory usage. Consider implementing memory management and cleanup.")
-        elif peak_memory_usage > self.thresholds["memory_usage_warning"]:
-            recommendations.append("Warning: High memory usage. Monitor memory leaks and optimize data structures.")
-        
-        # CPU usage recommendations
-        if average_cpu_usage > self.thresholds["cpu_usage_critical"]:
-            recommendations.append("Critical: Very high CPU usage. Consider scaling horizontally or optimizing algorithms.")
-        elif average_cpu_usage > self.thresholds["cpu_usage_warning"]:
-            recommendations.append("Warning: High CPU usage. Review computational efficiency and consider parallelization.")
+        recommendations = []
+        for measure, warning, critical, warning_message, critical_message in self._recommendation_rules:
+            value = measures[measure]
+            if value is None:
+                continue
+            if value > critical:
+                recommendations.append(critical_message)
+            elif value > warning:
+                recommendations.append(warning_message)
         
         # General recommendations
         if not recommendations:
@@ -401,31 +841,42 @@ class PerformanceMonitor:
         
         return recommendations
     
-    def get_realtime_metrics(self) -> Dict[str, Any]:
-        """Get real-time performance metrics"""
+    def get_realtime_metrics(self, max_age_sec: float = 10.0) -> Dict[str, Any]:
+        """Get real-time performance metrics
+        
+        System usage comes from the latest monitoring sample; it is refreshed
+        with non-blocking psutil reads only when older than max_age_sec.
+        """
         try:
             # Get current system metrics
-            memory = psutil.virtual_memory()
-            cpu_percent = psutil.cpu_percent(interval=1)
+            sampled_at, cpu_percent, memory = self._last_system
+            if memory is None or time.monotonic() - sampled_at > max_age_sec:
+                memory = psutil.virtual_memory()
+                cpu_percent = psutil.cpu_percent(interval=None)
+                self._last_system = (time.monotonic(), cpu_percent, memory)
             
             # Calculate recent statistics
-            recent_metrics = [m for m in self.metrics_history 
-                            if m.timestamp > datetime.now() - timedelta(minutes=5)]
-            
-            recent_execution_times = [m.value for m in recent_metrics 
-                                    if m.metric_type == MetricType.EXECUTION_TIME]
+            now = self._now()
+            session = _RunningTotals()
+            with self._agg_lock:
+                pending = list(self._local_stats)
+                recent_execution_times, _, _ = self._window(MetricType.EXECUTION_TIME, now - 300, now, pending)
+                session.add(self._totals)
+                for stats in pending:
+                    session.add(stats.totals)
             
             return {
                 "timestamp": datetime.now().isoformat(),
                 "system": {
                     "memory_usage_percent": memory.percent,
                     "cpu_usage_percent": cpu_percent,
-                    "memory_available_gb": memory.available / (1024**3)
+                    "memory_available_gb": memory.available * self._gb
                 },
                 "performance": {
-                    "recent_executions": len(recent_execution_times),
-                    "average_execution_time": statistics.mean(recent_execution_times) if recent_execution_times else 0,
-                    "total_metrics_recorded": len(self.metrics_history)
+                    "recent_executions": int(recent_execution_times.size),
+                    "average_execution_time": float(recent_execution_times.mean()) if recent_execution_times.size else 0,
+                    "execution_time_stdev": session.exec_stdev(),
+                    "total_metrics_recorded": session.exec_count + session.db_count + session.agent_count
                 },
                 "monitoring": {
                     "is_active": self.is_monitoring,
@@ -434,7 +885,7 @@ class PerformanceMonitor:
             }
             
         except Exception as e:
-            self.logger.error(f"Error getting real-time metrics: {str(e)}")
+            self.logger.error("Error getting real-time metrics: %s", e)
             return {"error": str(e)}
 
 def main():
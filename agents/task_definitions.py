@@ -5,16 +5,34 @@ Defines tasks, dependencies, and workflow orchestration for credit agents
 """
 
 import asyncio
+import atexit
 import time
 import json
 import logging
-from typing import Dict, List, Any, Optional, Union, Callable
-from dataclasses import dataclass, field
+import graphlib
+import hashlib
+import os
+import threading
+import uuid
+from collections import Counter, OrderedDict, deque
+from typing import Deque, Dict, List, Any, Mapping, Optional, Sequence, Set, Tuple, Union, Callable
+from dataclasses import dataclass, field, replace
+from types import MappingProxyType
 from datetime import datetime, timedelta
 from enum import Enum
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import Future, ThreadPoolExecutor
 
-from .base_agent import AgentContext, AgentResult, AgentStatus
+try:
+    import diskcache
+except ImportError:  # optional cross-process result cache
+    diskcache = None
+
+try:
+    import orjson as _orjson
+except ImportError:  # optional faster JSON serialization
+    _orjson = None
+
+from .base_agent import AgentContext, AgentResult, AgentStatus, create_agent_context
 from .credit_agents import (
     DataCollectionAgent, RiskAnalysisAgent, DocumentationAgent, ReportingAgent,
     CreditAgentOrchestrator
@@ -45,7 +63,7 @@ class TaskType(Enum):
     VALIDATION = "validation"
     APPROVAL = "approval"
 
-@dataclass
+@dataclass(slots=True)
 class TaskDefinition:
     """Definition of a workflow task"""
     task_id: str
@@ -56,77 +74,274 @@ class TaskDefinition:
     timeout: int = 300  # seconds
     max_retries: int = 3
     retry_delay: int = 30  # seconds
-    dependencies: List[str] = field(default_factory=list)
-    required_agents: List[str] = field(default_factory=list)
-    validation_rules: Dict[str, Any] = field(default_factory=dict)
-    success_criteria: Dict[str, Any] = field(default_factory=dict)
+    dependencies: Tuple[str, ...] = ()
+    required_agents: Tuple[str, ...] = ()
+    validation_rules: Mapping[str, Any] = field(default_factory=dict)
+    success_criteria: Mapping[str, Any] = field(default_factory=dict)
     metadata: Dict[str, Any] = field(default_factory=dict)
+    cache_ttl: int = 0  # seconds to reuse a successful result for identical inputs; 0 disables (opt in per task)
+    _compiled_checker: Optional[Callable[[Dict[str, Any]], bool]] = field(
+        default=None, init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        # Success criteria never change after construction; compile them once
+        self._compiled_checker = _compile_criteria(self.success_criteria)
+
+def _compile_criteria(criteria: Mapping[str, Any]) -> Callable[[Dict[str, Any]], bool]:
+    """Build a checker for result data from success criteria.
+
+    "defined" requires a truthy value, numbers are minimums and any other
+    value must match exactly.
+    """
+    checks = []
+    for key, expected in criteria.items():
+        if expected == "defined":
+            checks.append(lambda data, k=key: bool(data.get(k)))
+        elif isinstance(expected, (int, float)) and not isinstance(expected, bool):
+            checks.append(lambda data, k=key, v=expected: data.get(k, 0) >= v)
+        else:
+            checks.append(lambda data, k=key, v=expected: data.get(k) == v)
+    
+    if not checks:
+        return lambda data: True
+    if len(checks) == 1:
+        return checks[0]
+    checks = tuple(checks)
+    return lambda data: all(check(data) for check in checks)
+
+_EXECUTION_LOG_SIZE = 128
 
-@dataclass
+@dataclass(slots=True)
 class TaskExecution:
     """Task execution instance"""
     task_definition: TaskDefinition
     context: AgentContext
     status: TaskStatus = TaskStatus.PENDING
-    start_time: Optional[datetime] = None
+    start_time: Optional[datetime] = None  # wall clock, for display
     end_time: Optional[datetime] = None
+    start_ns: int = 0  # time.monotonic_ns() readings, for durations
+    end_ns: int = 0
     result: Optional[AgentResult] = None
     error: Optional[str] = None
     retry_count: int = 0
-    execution_log: List[Dict[str, Any]] = field(default_factory=list)
+    execution_log: Deque[Dict[str, Any]] = field(
+        default_factory=lambda: deque(maxlen=_EXECUTION_LOG_SIZE))  # most recent events only
     dependencies_completed: List[str] = field(default_factory=list)
 
+# Keyword under which each required agent is passed to execute()
+_AGENT_KWARGS: Dict[str, str] = {
+    "data_collection_agent": "data_agent",
+    "risk_analysis_agent": "risk_agent",
+    "documentation_agent": "doc_agent",
+    "reporting_agent": "report_agent",
+}
+
+# Per-type definition templates; tasks bind their id, description and metadata with replace()
+_PROTOTYPES: Dict[TaskType, TaskDefinition] = {
+    TaskType.DATA_COLLECTION: TaskDefinition(
+        task_id="",
+        task_type=TaskType.DATA_COLLECTION,
+        name="Customer Data Collection",
+        description="",
+        priority=TaskPriority.HIGH,
+        timeout=600,
+        max_retries=3,
+        required_agents=("data_collection_agent",),
+        validation_rules=MappingProxyType({}),
+        success_criteria=MappingProxyType({
+            "data_sources_count": 3,
+            "collection_quality": 0.8
+        })
+    ),
+    TaskType.RISK_ANALYSIS: TaskDefinition(
+        task_id="",
+        task_type=TaskType.RISK_ANALYSIS,
+        name="Credit Risk Analysis",
+        description="Analyze credit risk for loan application",
+        priority=TaskPriority.CRITICAL,
+        timeout=900,
+        max_retries=2,
+        dependencies=("data_collection",),
+        required_agents=("risk_analysis_agent",),
+        validation_rules=MappingProxyType({}),
+        success_criteria=MappingProxyType({
+            "risk_level": "defined",
+            "confidence_level": 0.7
+        })
+    ),
+    TaskType.DOCUMENTATION: TaskDefinition(
+        task_id="",
+        task_type=TaskType.DOCUMENTATION,
+        name="Documentation Creation",
+        description="Create comprehensive documentation package",
+        priority=TaskPriority.HIGH,
+        timeout=600,
+        max_retries=2,
+        dependencies=("data_collection", "risk_analysis"),
+        required_agents=("documentation_agent",),
+        validation_rules=MappingProxyType({}),
+        success_criteria=MappingProxyType({
+            "compliance_status": "Compliant",
+            "sections_count": 4
+        })
+    ),
+    TaskType.REPORTING: TaskDefinition(
+        task_id="",
+        task_type=TaskType.REPORTING,
+        name="Report Generation",
+        description="Generate comprehensive credit report",
+        priority=TaskPriority.NORMAL,
+        timeout=300,
+        max_retries=2,
+        dependencies=("data_collection", "risk_analysis", "documentation"),
+        required_agents=("reporting_agent",),
+        validation_rules=MappingProxyType({}),
+        success_criteria=MappingProxyType({
+            "recommendations_count": 1,
+            "executive_summary": "complete"
+        })
+    ),
+}
+
+def _dumps_sorted(obj: Any) -> bytes:
+    """Serialize to canonical (key-sorted) JSON bytes, using orjson when available"""
+    if _orjson is not None:
+        return _orjson.dumps(obj, default=str,
+                             option=_orjson.OPT_SORT_KEYS | _orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, sort_keys=True, separators=(",", ":"), default=str).encode()
+
+class _TaskResultCache:
+    """LRU of successful task result payloads with per-entry expiry
+    
+    Entries are also written to a diskcache.Cache when TASK_CACHE_DIR is set
+    and diskcache is installed, so results survive across processes.
+    """
+    
+    def __init__(self, maxsize: int = 256, directory: Optional[str] = None):
+        self.maxsize = maxsize
+        self._entries: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+        self._disk = diskcache.Cache(directory) if diskcache is not None and directory else None
+    
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Get a cached payload, or None if missing or expired"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                expires_at, data = entry
+                if expires_at > time.monotonic():
+                    self._entries.move_to_end(key)
+                    return data
+                del self._entries[key]
+        
+        if self._disk is not None:
+            return self._disk.get(key)
+        return None
+    
+    def set(self, key: str, data: Dict[str, Any], ttl: int):
+        """Cache a payload for ttl seconds"""
+        if ttl <= 0:
+            return
+        
+        with self._lock:
+            self._entries[key] = (time.monotonic() + ttl, data)
+            self._entries.move_to_end(key)
+            if len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+        
+        if self._disk is not None:
+            self._disk.set(key, data, expire=ttl)
+
+# Worker threads for blocking agent calls, shared by every workflow in the process
+_SHARED_EXECUTOR = ThreadPoolExecutor(
+    max_workers=int(os.getenv("CREDIT_WORKFLOW_THREADS", 8)),
+    thread_name_prefix="credit-wf"
+)
+atexit.register(_SHARED_EXECUTOR.shutdown, wait=False)
+
+# Shared by all coordinators so repeated workflows reuse results
+_RESULT_CACHE = _TaskResultCache(directory=os.getenv("TASK_CACHE_DIR"))
+
+class _TaskLogAdapter(logging.LoggerAdapter):
+    """Prefixes messages with the task id so all tasks share one logger"""
+    
+    def process(self, msg, kwargs):
+        return f"[{self.extra['task_id']}] {msg}", kwargs
+
+# One logger for all tasks; per-task loggers would accumulate in the logging manager
+_TASK_LOGGER = logging.getLogger("Task")
+
 class BaseTask:
     """Base class for all tasks"""
     
     def __init__(self, task_definition: TaskDefinition):
         self.definition = task_definition
-        self.logger = logging.getLogger(f"Task.{task_definition.task_id}")
+        self.logger = _TaskLogAdapter(_TASK_LOGGER, {"task_id": task_definition.task_id})
+        # Worker-pool call of the latest execute_async attempt; a timeout cannot stop it
+        self._pending: Optional[Future] = None
     
     def validate_prerequisites(self, context: AgentContext) -> bool:
         """Validate task prerequisites"""
-        self.logger.info(f"Validating prerequisites for task: {self.definition.name}")
+        self.logger.info("Validating prerequisites for task: %s", self.definition.name)
         return True
     
     def execute(self, context: AgentContext, **kwargs) -> AgentResult:
         """Execute the task"""
         raise NotImplementedError("Subclasses must implement execute method")
     
+    async def execute_async(self, context: AgentContext, **kwargs) -> AgentResult:
+        """Execute the task without blocking the event loop
+        
+        Agents only expose a blocking run(), so by default execute() is run
+        on the shared worker pool; subclasses with async agents can override this.
+        """
+        self._pending = _SHARED_EXECUTOR.submit(self.execute, context, **kwargs)
+        return await asyncio.wrap_future(self._pending)
+    
+    def is_running(self) -> bool:
+        """Whether an earlier attempt is still executing on the worker pool"""
+        return self._pending is not None and not self._pending.done()
+    
     def validate_result(self, result: AgentResult) -> bool:
         """Validate task result"""
         if not result.success:
             return False
         
-        # Check success criteria
-        for criterion, expected_value in self.definition.success_criteria.items():
-            if criterion in result.data:
-                if result.data[criterion] != expected_value:
-                    self.logger.warning(f"Success criterion failed: {criterion}")
-                    return False
+        if not self.definition._compiled_checker(result.data or {}):
+            self.logger.warning("Success criteria not met")
+            return False
         
         return True
     
     def cleanup(self, context: AgentContext):
         """Cleanup after task execution"""
-        self.logger.info(f"Cleaning up task: {self.definition.name}")
+        self.logger.info("Cleaning up task: %s", self.definition.name)
+    
+    def bind_upstream(self, upstream: Dict[str, Dict[str, Any]]):
+        """Take inputs from completed dependency results, keyed by their task type value"""
+        pass
+    
+    def _cache_inputs(self) -> Optional[Dict[str, Any]]:
+        """Inputs that fully determine the task result, or None if not cacheable"""
+        return None
+    
+    def _cache_key(self) -> Optional[str]:
+        """Stable hash of the task type and inputs"""
+        inputs = self._cache_inputs()
+        if inputs is None:
+            return None
+        
+        payload = _dumps_sorted({'type': self.definition.task_type.value, 'inputs': inputs})
+        return hashlib.blake2b(payload, digest_size=16).hexdigest()
 
 class DataCollectionTask(BaseTask):
     """Data collection task"""
     
     def __init__(self, customer_id: str, collection_scope: str = "comprehensive"):
-        task_def = TaskDefinition(
-            task_id=f"data_collection_{customer_id}_{int(time.time())}",
-            task_type=TaskType.DATA_COLLECTION,
-            name="Customer Data Collection",
+        task_def = replace(
+            _PROTOTYPES[TaskType.DATA_COLLECTION],
+            task_id=f"data_collection_{customer_id}_{uuid.uuid4().hex[:8]}",
             description=f"Collect comprehensive data for customer {customer_id}",
-            priority=TaskPriority.HIGH,
-            timeout=600,
-            max_retries=3,
-            required_agents=["data_collection_agent"],
-            success_criteria={
-                "data_sources_count": 3,
-                "collection_quality": 0.8
-            },
             metadata={
                 "customer_id": customer_id,
                 "collection_scope": collection_scope
@@ -136,6 +351,9 @@ class DataCollectionTask(BaseTask):
         self.customer_id = customer_id
         self.collection_scope = collection_scope
     
+    def _cache_inputs(self) -> Optional[Dict[str, Any]]:
+        return {"customer_id": self.customer_id, "scope": self.collection_scope}
+    
     def validate_prerequisites(self, context: AgentContext) -> bool:
         """Validate data collection prerequisites"""
         # Check if customer ID is provided
@@ -152,7 +370,7 @@ class DataCollectionTask(BaseTask):
     
     def execute(self, context: AgentContext, **kwargs) -> AgentResult:
         """Execute data collection task"""
-        self.logger.info(f"Executing data collection for customer: {self.customer_id}")
+        self.logger.info("Executing data collection for customer: %s", self.customer_id)
         
         # Get the data collection agent
         data_agent = kwargs.get('data_agent')
@@ -165,50 +383,48 @@ class DataCollectionTask(BaseTask):
             )
         
         # Execute data collection
-        result = data_agent.run(context, self.customer_id, self.collection_scope)
+        return data_agent.run(context, self.customer_id, self.collection_scope)
+    
+    def validate_result(self, result: AgentResult) -> bool:
+        """Validate collected data against the source count criterion"""
+        if not result.success:
+            return False
         
-        # Validate result
-        if result.success:
-            data_sources = result.data.get('data_sources', [])
-            collection_summary = result.data.get('collection_summary', {})
-            
-            # Check success criteria
-            if len(data_sources) >= self.definition.success_criteria['data_sources_count']:
-                self.logger.info(f"Data collection successful: {len(data_sources)} sources")
-            else:
-                self.logger.warning(f"Insufficient data sources: {len(data_sources)}")
-                result.success = False
-                result.error = f"Insufficient data sources collected: {len(data_sources)}"
+        data_sources = (result.data or {}).get('data_sources', [])
+        if len(data_sources) >= self.definition.success_criteria['data_sources_count']:
+            self.logger.info("Data collection successful: %d sources", len(data_sources))
+            return True
         
-        return result
+        self.logger.warning("Insufficient data sources: %d", len(data_sources))
+        result.error = f"Insufficient data sources collected: {len(data_sources)}"
+        return False
 
 class RiskAnalysisTask(BaseTask):
     """Risk analysis task"""
     
-    def __init__(self, customer_data: Dict[str, Any], loan_details: Dict[str, Any]):
-        task_def = TaskDefinition(
-            task_id=f"risk_analysis_{int(time.time())}",
-            task_type=TaskType.RISK_ANALYSIS,
-            name="Credit Risk Analysis",
-            description="Analyze credit risk for loan application",
-            priority=TaskPriority.CRITICAL,
-            timeout=900,
-            max_retries=2,
-            dependencies=["data_collection"],
-            required_agents=["risk_analysis_agent"],
-            success_criteria={
-                "risk_level": "defined",
-                "confidence_level": 0.7
-            },
+    def __init__(self, customer_data: Dict[str, Any], loan_details: Dict[str, Any],
+                 dependency_ids: Optional[Sequence[str]] = None):
+        prototype = _PROTOTYPES[TaskType.RISK_ANALYSIS]
+        task_def = replace(
+            prototype,
+            task_id=f"risk_analysis_{uuid.uuid4().hex[:8]}",
+            dependencies=tuple(dependency_ids) if dependency_ids is not None else prototype.dependencies,
             metadata={
                 "loan_amount": loan_details.get('amount'),
-                "loan_type": loan_details.get('type')
+                "loan_type": loan_details.get('type'),
+                "loan_details": loan_details
             }
         )
         super().__init__(task_def)
         self.customer_data = customer_data
         self.loan_details = loan_details
     
+    def bind_upstream(self, upstream: Dict[str, Dict[str, Any]]):
+        self.customer_data = upstream.get(TaskType.DATA_COLLECTION.value, self.customer_data)
+    
+    def _cache_inputs(self) -> Optional[Dict[str, Any]]:
+        return {"customer_data": self.customer_data, "loan_details": self.loan_details}
+    
     def validate_prerequisites(self, context: AgentContext) -> bool:
         """Validate risk analysis prerequisites"""
         # Check if customer data is available
@@ -238,50 +454,45 @@ class RiskAnalysisTask(BaseTask):
             )
         
         # Execute risk analysis
-        result = risk_agent.run(
+        return risk_agent.run(
             context, 
             self.customer_data, 
             self.loan_details.get('amount'), 
             self.loan_details.get('type')
         )
+    
+    def validate_result(self, result: AgentResult) -> bool:
+        """Validate that a risk level was produced with sufficient confidence"""
+        if not result.success:
+            return False
         
-        # Validate result
-        if result.success:
-            risk_level = result.data.get('risk_level')
-            confidence_level = result.data.get('confidence_level', 0)
-            
-            # Check success criteria
-            if risk_level and confidence_level >= self.definition.success_criteria['confidence_level']:
-                self.logger.info(f"Risk analysis successful: {risk_level} risk, {confidence_level:.2%} confidence")
-            else:
-                self.logger.warning(f"Risk analysis quality insufficient: {confidence_level:.2%} confidence")
-                result.success = False
-                result.error = f"Insufficient confidence level: {confidence_level:.2%}"
+        data = result.data or {}
+        risk_level = data.get('risk_level')
+        confidence_level = data.get('confidence_level', 0)
         
-        return result
+        # Criteria keys match the result keys here, so the compiled checker applies directly
+        if self.definition._compiled_checker(data):
+            self.logger.info("Risk analysis successful: %s risk, %.2f%% confidence", risk_level, confidence_level * 100)
+            return True
+        
+        self.logger.warning("Risk analysis quality insufficient: %.2f%% confidence", confidence_level * 100)
+        result.error = f"Insufficient confidence level: {confidence_level:.2%}"
+        return False
 
 class DocumentationTask(BaseTask):
     """Documentation task"""
     
     def __init__(self, customer_data: Dict[str, Any], risk_assessment: Dict[str, Any], 
-               loan_details: Dict[str, Any]):
-        task_def = TaskDefinition(
-            task_id=f"documentation_{int(time.time())}",
-            task_type=TaskType.DOCUMENTATION,
-            name="Documentation Creation",
-            description="Create comprehensive documentation package",
-            priority=TaskPriority.HIGH,
-            timeout=600,
-            max_retries=2,
-            dependencies=["data_collection", "risk_analysis"],
-            required_agents=["documentation_agent"],
-            success_criteria={
-                "compliance_status": "Compliant",
-                "sections_count": 4
-            },
+               loan_details: Dict[str, Any], dependency_ids: Optional[Sequence[str]] = None):
+        prototype = _PROTOTYPES[TaskType.DOCUMENTATION]
+        task_def = replace(
+            prototype,
+            task_id=f"documentation_{uuid.uuid4().hex[:8]}",
+            dependencies=tuple(dependency_ids) if dependency_ids is not None else prototype.dependencies,
             metadata={
                 "loan_type": loan_details.get('type'),
-                "risk_level": risk_assessment.get('risk_level')
+                "risk_level": risk_assessment.get('risk_level'),
+                "loan_details": loan_details
             }
         )
         super().__init__(task_def)
@@ -289,6 +500,14 @@ class DocumentationTask(BaseTask):
         self.risk_assessment = risk_assessment
         self.loan_details = loan_details
     
+    def bind_upstream(self, upstream: Dict[str, Dict[str, Any]]):
+        self.customer_data = upstream.get(TaskType.DATA_COLLECTION.value, self.customer_data)
+        self.risk_assessment = upstream.get(TaskType.RISK_ANALYSIS.value, self.risk_assessment)
+    
+    def _cache_inputs(self) -> Optional[Dict[str, Any]]:
+        return {"customer_data": self.customer_data, "risk_assessment": self.risk_assessment,
+                "loan_details": self.loan_details}
+    
     def validate_prerequisites(self, context: AgentContext) -> bool:
         """Validate documentation prerequisites"""
         # Check if customer data is available
@@ -318,48 +537,42 @@ class DocumentationTask(BaseTask):
             )
         
         # Execute documentation creation
-        result = doc_agent.run(
+        return doc_agent.run(
             context, 
             self.customer_data, 
             self.risk_assessment, 
             self.loan_details
         )
+    
+    def validate_result(self, result: AgentResult) -> bool:
+        """Validate compliance status and section count of the documentation"""
+        if not result.success:
+            return False
         
-        # Validate result
-        if result.success:
-            compliance_status = result.data.get('compliance_status')
-            sections_count = len(result.data.get('sections', {}))
-            
-            # Check success criteria
-            if (compliance_status == self.definition.success_criteria['compliance_status'] and
-                sections_count >= self.definition.success_criteria['sections_count']):
-                self.logger.info(f"Documentation successful: {compliance_status}, {sections_count} sections")
-            else:
-                self.logger.warning(f"Documentation quality insufficient: {compliance_status}, {sections_count} sections")
-                result.success = False
-                result.error = f"Documentation quality insufficient: {compliance_status}"
+        data = result.data or {}
+        compliance_status = data.get('compliance_status')
+        sections_count = len(data.get('sections', {}))
         
-        return result
+        if (compliance_status == self.definition.success_criteria['compliance_status'] and
+            sections_count >= self.definition.success_criteria['sections_count']):
+            self.logger.info("Documentation successful: %s, %d sections", compliance_status, sections_count)
+            return True
+        
+        self.logger.warning("Documentation quality insufficient: %s, %d sections", compliance_status, sections_count)
+        result.error = f"Documentation quality insufficient: {compliance_status}"
+        return False
 
 class ReportingTask(BaseTask):
     """Reporting task"""
     
     def __init__(self, customer_data: Dict[str, Any], risk_assessment: Dict[str, Any], 
-               documentation: Dict[str, Any], report_type: str = "comprehensive"):
-        task_def = TaskDefinition(
-            task_id=f"reporting_{int(time.time())}",
-            task_type=TaskType.REPORTING,
-            name="Report Generation",
-            description="Generate comprehensive credit report",
-            priority=TaskPriority.NORMAL,
-            timeout=300,
-            max_retries=2,
-            dependencies=["data_collection", "risk_analysis", "documentation"],
-            required_agents=["reporting_agent"],
-            success_criteria={
-                "recommendations_count": 1,
-                "executive_summary": "complete"
-            },
+               documentation: Dict[str, Any], report_type: str = "comprehensive",
+               dependency_ids: Optional[Sequence[str]] = None):
+        prototype = _PROTOTYPES[TaskType.REPORTING]
+        task_def = replace(
+            prototype,
+            task_id=f"reporting_{uuid.uuid4().hex[:8]}",
+            dependencies=tuple(dependency_ids) if dependency_ids is not None else prototype.dependencies,
             metadata={
                 "report_type": report_type,
                 "risk_level": risk_assessment.get('risk_level')
@@ -371,6 +584,15 @@ class ReportingTask(BaseTask):
         self.documentation = documentation
         self.report_type = report_type
     
+    def bind_upstream(self, upstream: Dict[str, Dict[str, Any]]):
+        self.customer_data = upstream.get(TaskType.DATA_COLLECTION.value, self.customer_data)
+        self.risk_assessment = upstream.get(TaskType.RISK_ANALYSIS.value, self.risk_assessment)
+        self.documentation = upstream.get(TaskType.DOCUMENTATION.value, self.documentation)
+    
+    def _cache_inputs(self) -> Optional[Dict[str, Any]]:
+        return {"customer_data": self.customer_data, "risk_assessment": self.risk_assessment,
+                "documentation": self.documentation, "report_type": self.report_type}
+    
     def validate_prerequisites(self, context: AgentContext) -> bool:
         """Validate reporting prerequisites"""
         # Check if all required data is available
@@ -382,7 +604,7 @@ class ReportingTask(BaseTask):
     
     def execute(self, context: AgentContext, **kwargs) -> AgentResult:
         """Execute reporting task"""
-        self.logger.info(f"Executing report generation: {self.report_type}")
+        self.logger.info("Executing report generation: %s", self.report_type)
         
         # Get the reporting agent
         report_agent = kwargs.get('report_agent')
@@ -395,38 +617,66 @@ class ReportingTask(BaseTask):
             )
         
         # Execute report generation
-        result = report_agent.run(
+        return report_agent.run(
             context, 
             self.customer_data, 
             self.risk_assessment, 
             self.documentation, 
             self.report_type
         )
+    
+    def validate_result(self, result: AgentResult) -> bool:
+        """Validate recommendations and executive summary of the report"""
+        if not result.success:
+            return False
         
-        # Validate result
-        if result.success:
-            recommendations = result.data.get('recommendations', [])
-            executive_summary = result.data.get('executive_summary', {})
-            
-            # Check success criteria
-            if (len(recommendations) >= self.definition.success_criteria['recommendations_count'] and
-                executive_summary):
-                self.logger.info(f"Report generation successful: {len(recommendations)} recommendations")
-            else:
-                self.logger.warning(f"Report quality insufficient: {len(recommendations)} recommendations")
-                result.success = False
-                result.error = f"Insufficient recommendations: {len(recommendations)}"
+        data = result.data or {}
+        recommendations = data.get('recommendations', [])
+        executive_summary = data.get('executive_summary', {})
         
-        return result
+        if len(recommendations) >= self.definition.success_criteria['recommendations_count'] and executive_summary:
+            self.logger.info("Report generation successful: %d recommendations", len(recommendations))
+            return True
+        
+        self.logger.warning("Report quality insufficient: %d recommendations", len(recommendations))
+        result.error = f"Insufficient recommendations: {len(recommendations)}"
+        return False
+
+# Builds a runnable task from a stored definition, keyed by task type
+_TASK_FACTORY: Dict[TaskType, Callable[[TaskDefinition], BaseTask]] = {
+    TaskType.DATA_COLLECTION: lambda d: DataCollectionTask(
+        d.metadata.get('customer_id'),
+        d.metadata.get('collection_scope', 'comprehensive')
+    ),
+    TaskType.RISK_ANALYSIS: lambda d: RiskAnalysisTask(
+        d.metadata.get('customer_data', {}),
+        d.metadata.get('loan_details', {})
+    ),
+    TaskType.DOCUMENTATION: lambda d: DocumentationTask(
+        d.metadata.get('customer_data', {}),
+        d.metadata.get('risk_assessment', {}),
+        d.metadata.get('loan_details', {})
+    ),
+    TaskType.REPORTING: lambda d: ReportingTask(
+        d.metadata.get('customer_data', {}),
+        d.metadata.get('risk_assessment', {}),
+        d.metadata.get('documentation', {}),
+        d.metadata.get('report_type', 'comprehensive')
+    ),
+}
 
 class TaskCoordinator:
     """Coordinates task execution and dependencies"""
     
-    def __init__(self):
+    def __init__(self, max_parallel: int = 4):
         self.tasks: Dict[str, TaskExecution] = {}
+        self.results: Dict[str, Dict[str, Any]] = {}  # result data of completed tasks by task_id
+        self._reverse_deps: Dict[str, Set[str]] = {}  # task_id -> ids of tasks depending on it
         self.execution_order: List[str] = []
+        self._status_counts: Counter = Counter({status: 0 for status in TaskStatus})
         self.logger = logging.getLogger("TaskCoordinator")
-        self.executor = ThreadPoolExecutor(max_workers=4)
+        self.max_parallel = max_parallel  # concurrent tasks per workflow level
+        self._cache = _RESULT_CACHE
     
     def add_task(self, task: BaseTask, context: AgentContext) -> str:
         """Add a task to the coordinator"""
@@ -435,56 +685,88 @@ class TaskCoordinator:
             context=context
         )
         
+        replaced = self.tasks.get(task.definition.task_id)
+        if replaced is not None:
+            self._status_counts[replaced.status] -= 1
         self.tasks[task.definition.task_id] = task_execution
-        self.logger.info(f"Added task: {task.definition.name} ({task.definition.task_id})")
+        self._status_counts[task_execution.status] += 1
+        for dep in task.definition.dependencies:
+            self._reverse_deps.setdefault(dep, set()).add(task.definition.task_id)
+        self.logger.info("Added task: %s (%s)", task.definition.name, task.definition.task_id)
         
         return task.definition.task_id
     
+    def reset(self):
+        """Drop all tasks and results so the coordinator can run a fresh workflow"""
+        self.tasks.clear()
+        self.results.clear()
+        self._reverse_deps.clear()
+        self.execution_order.clear()
+        self._status_counts = Counter({status: 0 for status in TaskStatus})
+    
+    def _set_status(self, task_exec: TaskExecution, status: TaskStatus):
+        """Change a task's status, keeping the status counts in step"""
+        self._status_counts[task_exec.status] -= 1
+        task_exec.status = status
+        self._status_counts[status] += 1
+    
     def resolve_dependencies(self) -> List[List[str]]:
         """Resolve task dependencies and return execution order"""
-        # Create dependency graph
-        dependency_graph = {}
+        # Split off tasks without dependencies; dependencies on unknown tasks are ignored
+        roots = []
+        dependents = {}
         for task_id, task_exec in self.tasks.items():
-            dependency_graph[task_id] = task_exec.task_definition.dependencies
+            dependencies = [dep for dep in task_exec.task_definition.dependencies if dep in self.tasks]
+            if dependencies:
+                dependents[task_id] = dependencies
+            else:
+                roots.append(task_id)
         
-        # Topological sort
-        execution_levels = []
-        visited = set()
-        temp_visited = set()
+        execution_levels = [roots] if roots else []
         
-        def dfs(node: str, level: int):
-            if node in temp_visited:
-                raise ValueError(f"Circular dependency detected: {node}")
-            
-            if node in visited:
-                return
+        # Only the remaining tasks need a topological sort, starting at level 1
+        if dependents:
+            scheduled = set(roots)
+            sorter = graphlib.TopologicalSorter()
+            for task_id, dependencies in dependents.items():
+                sorter.add(task_id, *(dep for dep in dependencies if dep not in scheduled))
             
-            temp_visited.add(node)
+            try:
+                sorter.prepare()
+            except graphlib.CycleError as e:
+                raise ValueError(f"Circular dependency detected: {e.args[1]}") from e
             
-            # Process dependencies first
-            for dep in dependency_graph.get(node, []):
-                if dep in self.tasks:
-                    dfs(dep, level + 1)
-            
-            temp_visited.remove(node)
-            visited.add(node)
-            
-            # Add to appropriate level
-            while len(execution_levels) <= level:
-                execution_levels.append([])
-            execution_levels[level].append(node)
-        
-        # Process all tasks
-        for task_id in self.tasks.keys():
-            if task_id not in visited:
-                dfs(task_id, 0)
+            # Each ready set is a level whose dependencies have all been scheduled
+            while sorter.is_active():
+                ready = sorter.get_ready()
+                execution_levels.append(list(ready))
+                sorter.done(*ready)
         
         self.execution_order = [task_id for level in execution_levels for task_id in level]
-        self.logger.info(f"Execution order resolved: {self.execution_order}")
+        self.logger.info("Execution order resolved: %s", self.execution_order)
         
         return execution_levels
     
+    def required_ancestors(self, target: str) -> Set[str]:
+        """Get the target task and every task it transitively depends on"""
+        if target not in self.tasks:
+            raise ValueError(f"Task not found: {target}")
+        
+        required = {target}
+        queue = deque([target])
+        while queue:
+            for dep in self.tasks[queue.popleft()].task_definition.dependencies:
+                if dep in self.tasks and dep not in required:
+                    required.add(dep)
+                    queue.append(dep)
+        
+        return required
+    
     def execute_task(self, task_id: str, agents: Dict[str, Any]) -> TaskExecution:
+        """Execute a single task (blocking wrapper around execute_task_async)"""
+        return asyncio.run(self.execute_task_async(task_id, agents))
+    
+    async def execute_task_async(self, task_id: str, agents: Dict[str, Any]) -> TaskExecution:
         """Execute a single task"""
         if task_id not in self.tasks:
             raise ValueError(f"Task not found: {task_id}")
@@ -492,123 +774,207 @@ class TaskCoordinator:
         task_exec = self.tasks[task_id]
         task = self._create_task_instance(task_exec.task_definition)
         
-        self.logger.info(f"Executing task: {task_exec.task_definition.name}")
-        task_exec.status = TaskStatus.RUNNING
+        # Feed completed upstream results to the task before it is validated
+        upstream = {
+            self.tasks[dep].task_definition.task_type.value: self.results[dep]
+            for dep in task_exec.task_definition.dependencies if dep in self.results
+        }
+        if upstream:
+            task.bind_upstream(upstream)
+        
+        self.logger.info("Executing task: %s", task_exec.task_definition.name)
+        self._set_status(task_exec, TaskStatus.RUNNING)
         task_exec.start_time = datetime.now()
+        task_exec.start_ns = time.monotonic_ns()
         
         try:
             # Validate prerequisites
             if not task.validate_prerequisites(task_exec.context):
                 raise ValueError("Task prerequisites not met")
             
-            # Execute task
-            result = task.execute(task_exec.context, **agents)
-            task_exec.result = result
+            # Reuse a cached result for identical inputs instead of calling the agent
+            ttl = task_exec.task_definition.cache_ttl
+            cache_key = task._cache_key() if ttl > 0 else None
+            cached = self._cache.get(cache_key) if cache_key else None
             
-            # Validate result
-            if result.success and not task.validate_result(result):
-                result.success = False
-                result.error = "Task result validation failed"
+            if cached is not None:
+                result = AgentResult(
+                    success=True,
+                    data=dict(cached),
+                    status=AgentStatus.SUCCESS,
+                    context=task_exec.context,
+                    metadata={"cache_hit": True}
+                )
+                task_exec.result = result
+            else:
+                # Execute task, retrying timeouts and failed agent runs
+                result = await self._execute_with_retries(task, task_exec, agents)
+                task_exec.result = result
+                
+                # Validate result
+                if result.success and not task.validate_result(result):
+                    result.success = False
+                    result.error = result.error or "Task result validation failed"
+                
+                if result.success and cache_key:
+                    self._cache.set(cache_key, dict(result.data or {}), ttl)
             
             if result.success:
-                task_exec.status = TaskStatus.COMPLETED
-                self.logger.info(f"Task completed successfully: {task_exec.task_definition.name}")
+                self.results[task_id] = result.data
+                self._set_status(task_exec, TaskStatus.COMPLETED)
+                self.logger.info("Task completed successfully: %s", task_exec.task_definition.name)
             else:
-                task_exec.status = TaskStatus.FAILED
+                self._set_status(task_exec, TaskStatus.FAILED)
                 task_exec.error = result.error
-                self.logger.error(f"Task failed: {task_exec.task_definition.name} - {result.error}")
+                self.logger.error("Task failed: %s - %s", task_exec.task_definition.name, result.error)
             
         except Exception as e:
-            task_exec.status = TaskStatus.FAILED
+            self._set_status(task_exec, TaskStatus.FAILED)
             task_exec.error = str(e)
-            self.logger.error(f"Task execution error: {task_exec.task_definition.name} - {str(e)}")
+            self.logger.error("Task execution error: %s - %s", task_exec.task_definition.name, e)
         
         finally:
-            task_exec.end_time = datetime.now()
+            task_exec.end_ns = time.monotonic_ns()
+            # Derive the display end time from the monotonic duration
+            elapsed = timedelta(microseconds=(task_exec.end_ns - task_exec.start_ns) / 1000)
+            task_exec.end_time = task_exec.start_time + elapsed
             task.cleanup(task_exec.context)
         
         return task_exec
     
+    async def _execute_with_retries(self, task: BaseTask, task_exec: TaskExecution,
+                                    agents: Dict[str, Any]) -> AgentResult:
+        """Run the task under its timeout, backing off between failed attempts"""
+        definition = task_exec.task_definition
+        result = None
+        
+        # A missing agent fails the same way on every attempt, so run once and report it
+        max_retries = definition.max_retries
+        if any(not agents.get(_AGENT_KWARGS.get(name, name)) for name in definition.required_agents):
+            max_retries = 0
+        
+        for attempt in range(max_retries + 1):
+            task_exec.execution_log.append(
+                {"ts": time.monotonic_ns(), "event": "attempt", "attempt": attempt})
+            try:
+                result = await asyncio.wait_for(
+                    task.execute_async(task_exec.context, **agents), timeout=definition.timeout)
+            except asyncio.TimeoutError:
+                result = AgentResult(
+                    success=False,
+                    data={},
+                    status=AgentStatus.FAILED,
+                    context=task_exec.context,
+                    error=f"Task timed out after {definition.timeout}s"
+                )
+                # The agent thread cannot be interrupted; a retry would run a second
+                # call on the same agent alongside it
+                if task.is_running():
+                    result.error += "; agent call still running, not retried"
+                    break
+            
+            if result.success:
+                break
+            
+            task_exec.execution_log.append(
+                {"ts": time.monotonic_ns(), "event": "failed", "attempt": attempt,
+                 "error": result.error})
+            if attempt < max_retries:
+                delay = definition.retry_delay * (2 ** attempt)
+                task_exec.retry_count += 1
+                self._set_status(task_exec, TaskStatus.RETRYING)
+                self.logger.warning("Retrying task %s in %ss (attempt %d/%d): %s",
+                                    definition.name, delay, attempt + 1,
+                                    max_retries, result.error)
+                await asyncio.sleep(delay)
+                self._set_status(task_exec, TaskStatus.RUNNING)
+        
+        return result
+    
     def _create_task_instance(self, task_def: TaskDefinition) -> BaseTask:
         """Create task instance from definition"""
-        # This would typically use a factory pattern
-        # For now, we'll create based on task type
-        if task_def.task_type == TaskType.DATA_COLLECTION:
-            return DataCollectionTask(
-                task_def.metadata.get('customer_id'),
-                task_def.metadata.get('collection_scope', 'comprehensive')
-            )
-        elif task_def.task_type == TaskType.RISK_ANALYSIS:
-            return RiskAnalysisTask(
-                task_def.metadata.get('customer_data', {}),
-                task_def.metadata.get('loan_details', {})
-            )
-        elif task_def.task_type == TaskType.DOCUMENTATION:
-            return DocumentationTask(
-                task_def.metadata.get('customer_data', {}),
-                task_def.metadata.get('risk_assessment', {}),
-                task_def.metadata.get('loan_details', {})
-            )
-        elif task_def.task_type == TaskType.REPORTING:
-            return ReportingTask(
-                task_def.metadata.get('customer_data', {}),
-                task_def.metadata.get('risk_assessment', {}),
-                task_def.metadata.get('documentation', {}),
-                task_def.metadata.get('report_type', 'comprehensive')
-            )
-        else:
-            raise ValueError(f"Unknown task type: {task_def.task_type}")
+        try:
+            factory = _TASK_FACTORY[task_def.task_type]
+        except KeyError:
+            raise ValueError(f"Unknown task type: {task_def.task_type}") from None
+        return factory(task_def)
+    
+    def execute_workflow(self, agents: Dict[str, Any], target: Optional[str] = None) -> Dict[str, TaskExecution]:
+        """Execute complete workflow (blocking wrapper around execute_workflow_async)"""
+        return asyncio.run(self.execute_workflow_async(agents, target))
+    
+    def run_to(self, target: str, agents: Dict[str, Any]) -> Dict[str, TaskExecution]:
+        """Execute only the target task and the tasks it depends on"""
+        return self.execute_workflow(agents, target=target)
     
-    def execute_workflow(self, agents: Dict[str, Any]) -> Dict[str, TaskExecution]:
-        """Execute complete workflow"""
+    async def execute_workflow_async(self, agents: Dict[str, Any],
+                                     target: Optional[str] = None) -> Dict[str, TaskExecution]:
+        """Execute complete workflow, or only what the target task needs when given"""
         self.logger.info("Starting workflow execution")
         
         # Resolve dependencies
         execution_levels = self.resolve_dependencies()
+        if target is not None:
+            required = self.required_ancestors(target)
+            execution_levels = [
+                [task_id for task_id in level if task_id in required] for level in execution_levels
+            ]
+            execution_levels = [level for level in execution_levels if level]
+        semaphore = asyncio.Semaphore(self.max_parallel)
+        
+        async def run_one(task_id: str) -> tuple:
+            if self.tasks[task_id].status == TaskStatus.CANCELLED:
+                return task_id, self.tasks[task_id]
+            async with semaphore:
+                try:
+                    return task_id, await self.execute_task_async(task_id, agents)
+                except Exception as e:
+                    return task_id, e
         
         # Execute tasks level by level
         for level_idx, level_tasks in enumerate(execution_levels):
-            self.logger.info(f"Executing level {level_idx + 1}: {level_tasks}")
-            
-            # Execute tasks in parallel within each level
-            futures = []
-            for task_id in level_tasks:
-                future = self.executor.submit(self.execute_task, task_id, agents)
-                futures.append((task_id, future))
+            self.logger.info("Executing level %d: %s", level_idx + 1, level_tasks)
             
-            # Wait for all tasks in this level to complete
-            for task_id, future in futures:
-                try:
-                    task_exec = future.result()
-                    self.logger.info(f"Level {level_idx + 1} task completed: {task_id}")
-                except Exception as e:
-                    self.logger.error(f"Level {level_idx + 1} task failed: {task_id} - {str(e)}")
+            # Execute tasks concurrently within each level and handle each one as it
+            # finishes; the next level starts only once this one is exhausted
+            for finished in asyncio.as_completed([run_one(task_id) for task_id in level_tasks]):
+                task_id, outcome = await finished
+                if isinstance(outcome, Exception):
+                    failed, error = True, str(outcome)
+                else:
+                    failed, error = outcome.status == TaskStatus.FAILED, outcome.error
+                
+                if failed:
+                    self.logger.error("Level %d task failed: %s - %s", level_idx + 1, task_id, error)
                     # Mark dependent tasks as cancelled
                     self._cancel_dependent_tasks(task_id)
+                elif outcome.status == TaskStatus.CANCELLED:
+                    self.logger.info("Level %d task skipped (cancelled): %s", level_idx + 1, task_id)
+                else:
+                    self.logger.info("Level %d task completed: %s", level_idx + 1, task_id)
         
         # Return execution results
         return {task_id: task_exec for task_id, task_exec in self.tasks.items()}
     
     def _cancel_dependent_tasks(self, failed_task_id: str):
-        """Cancel tasks that depend on the failed task"""
-        for task_id, task_exec in self.tasks.items():
-            if (failed_task_id in task_exec.task_definition.dependencies and 
-                task_exec.status == TaskStatus.PENDING):
-                task_exec.status = TaskStatus.CANCELLED
-                self.logger.info(f"Cancelled dependent task: {task_id}")
+        """Cancel pending tasks that directly or transitively depend on the failed task"""
+        queue = deque([failed_task_id])
+        while queue:
+            for task_id in self._reverse_deps.get(queue.popleft(), ()):
+                task_exec = self.tasks.get(task_id)
+                if task_exec is not None and task_exec.status == TaskStatus.PENDING:
+                    self._set_status(task_exec, TaskStatus.CANCELLED)
+                    self.logger.info("Cancelled dependent task: %s", task_id)
+                    queue.append(task_id)
     
     def get_workflow_status(self) -> Dict[str, Any]:
         """Get overall workflow status"""
-        status_counts = {}
-        for status in TaskStatus:
-            status_counts[status.value] = 0
-        
-        for task_exec in self.tasks.values():
-            status_counts[task_exec.status.value] += 1
+        # Counts are maintained by add_task/_set_status, so no scan over tasks is needed
+        status_counts = {status.value: count for status, count in self._status_counts.items()}
         
         total_tasks = len(self.tasks)
-        completed_tasks = status_counts[TaskStatus.COMPLETED.value]
-        failed_tasks = status_counts[TaskStatus.FAILED.value]
+        completed_tasks = self._status_counts[TaskStatus.COMPLETED]
+        failed_tasks = self._status_counts[TaskStatus.FAILED]
         
         return {
             "total_tasks": total_tasks,
@@ -630,22 +996,24 @@ class EnhancedCreditAgentOrchestrator(CreditAgentOrchestrator):
     def create_credit_workflow(self, customer_id: str, loan_details: Dict[str, Any], 
                              context: AgentContext) -> List[str]:
         """Create a complete credit workflow with tasks"""
-        self.logger.info(f"Creating credit workflow for customer: {customer_id}")
+        self.logger.info("Creating credit workflow for customer: %s", customer_id)
         
         # Create data collection task
         data_task = DataCollectionTask(customer_id, "comprehensive")
         data_task_id = self.task_coordinator.add_task(data_task, context)
         
         # Create risk analysis task (depends on data collection)
-        risk_task = RiskAnalysisTask({}, loan_details)  # Will be updated with actual data
+        risk_task = RiskAnalysisTask({}, loan_details, dependency_ids=[data_task_id])
         risk_task_id = self.task_coordinator.add_task(risk_task, context)
         
         # Create documentation task (depends on data collection and risk analysis)
-        doc_task = DocumentationTask({}, {}, loan_details)  # Will be updated with actual data
+        doc_task = DocumentationTask({}, {}, loan_details,
+                                     dependency_ids=[data_task_id, risk_task_id])
         doc_task_id = self.task_coordinator.add_task(doc_task, context)
         
         # Create reporting task (depends on all previous tasks)
-        report_task = ReportingTask({}, {}, {}, "comprehensive")  # Will be updated with actual data
+        report_task = ReportingTask({}, {}, {}, "comprehensive",
+                                    dependency_ids=[data_task_id, risk_task_id, doc_task_id])
         report_task_id = self.task_coordinator.add_task(report_task, context)
         
         return [data_task_id, risk_task_id, doc_task_id, report_task_id]
@@ -656,7 +1024,10 @@ class EnhancedCreditAgentOrchestrator(CreditAgentOrchestrator):
         if not context:
             context = create_agent_context(f"enhanced_workflow_{int(time.time())}")
         
-        self.logger.info(f"Running enhanced workflow for customer: {customer_id}")
+        self.logger.info("Running enhanced workflow for customer: %s", customer_id)
+        
+        # Start from an empty coordinator so earlier workflows are not re-resolved or re-run
+        self.task_coordinator.reset()
         
         # Create workflow tasks
         task_ids = self.create_credit_workflow(customer_id, loan_details, context)
@@ -669,12 +1040,9 @@ class EnhancedCreditAgentOrchestrator(CreditAgentOrchestrator):
             'report_agent': self.agents.get('reporting_agent')
         }
         
-        # Execute workflow
+        # Execute workflow; dependent tasks receive upstream results as they run
         workflow_results = self.task_coordinator.execute_workflow(agents)
         
-        # Update task data for dependent tasks
-        self._update_task_dependencies(workflow_results, customer_id, loan_details)
-        
         # Get workflow status
         workflow_status = self.task_coordinator.get_workflow_status()
         
@@ -685,52 +1053,6 @@ class EnhancedCreditAgentOrchestrator(CreditAgentOrchestrator):
             "workflow_status": workflow_status,
             "communication_log": self.communication_log
         }
-    
-    def _update_task_dependencies(self, workflow_results: Dict[str, TaskExecution], 
-                                customer_id: str, loan_details: Dict[str, Any]):
-        """Update task dependencies with actual data"""
-        # Find data collection result
-        data_result = None
-        for task_exec in workflow_results.values():
-            if task_exec.task_definition.task_type == TaskType.DATA_COLLECTION:
-                if task_exec.result and task_exec.result.success:
-                    data_result = task_exec.result.data
-                break
-        
-        # Find risk analysis result
-        risk_result = None
-        for task_exec in workflow_results.values():
-            if task_exec.task_definition.task_type == TaskType.RISK_ANALYSIS:
-                if task_exec.result and task_exec.result.success:
-                    risk_result = task_exec.result.data
-                break
-        
-        # Find documentation result
-        doc_result = None
-        for task_exec in workflow_results.values():
-            if task_exec.task_definition.task_type == TaskType.DOCUMENTATION:
-                if task_exec.result and task_exec.result.success:
-                    doc_result = task_exec.result.data
-                break
-        
-        # Update dependent tasks with actual data
-        for task_exec in workflow_results.values():
-            if task_exec.task_definition.task_type == TaskType.RISK_ANALYSIS and data_result:
-                task_exec.task_definition.metadata['customer_data'] = data_result
-            
-            elif task_exec.task_definition.task_type == TaskType.DOCUMENTATION:
-                if data_result:
-                    task_exec.task_definition.metadata['customer_data'] = data_result
-                if risk_result:
-                    task_exec.task_definition.metadata['risk_assessment'] = risk_result
-            
-            elif task_exec.task_definition.task_type == TaskType.REPORTING:
-                if data_result:
-                    task_exec.task_definition.metadata['customer_data'] = data_result
-                if risk_result:
-                    task_exec.task_definition.metadata['risk_assessment'] = risk_result
-                if doc_result:
-                    task_exec.task_definition.metadata['documentation'] = doc_result
 
 # Factory function for creating enhanced orchestrator
 def create_enhanced_credit_agents(customer_server_url: str = "http://localhost:8001", 
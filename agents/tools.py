@@ -8,15 +8,43 @@ import json
 import logging
 import time
 import asyncio
+import bisect
+import copy
+import functools
+import importlib.util
+import itertools
+import random
+import socket
+import threading
+import weakref
+from urllib.parse import urlparse
 from typing import Dict, List, Any, Optional, Union
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime, timedelta
+import httpx
 import requests
 from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection
+from urllib3.exceptions import MaxRetryError
 from urllib3.util.retry import Retry
 import pydantic
-from pydantic import BaseModel, Field, validator
-import numpy as np
+from pydantic import BaseModel, ConfigDict, Field, ValidationError, field_validator
+
+try:
+    import orjson
+except ImportError:  # optional faster JSON encoding/decoding
+    orjson = None
+
+try:
+    import ijson
+except ImportError:  # optional streaming parser for large responses
+    ijson = None
+
+try:
+    import aiohttp
+except ImportError:  # optional; async requests fall back to httpx
+    aiohttp = None
 
 # Configure logging
 logging.basicConfig(
@@ -25,7 +53,61 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-@dataclass
+def _json_dumps(obj: Any) -> bytes:
+    """Encode a request body as JSON bytes"""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj).encode()
+
+_json_loads = orjson.loads if orjson is not None else json.loads
+
+@functools.lru_cache(maxsize=16)
+def _economic_cycle_body(analysis_period: str) -> bytes:
+    """Serialized economic cycle request; the period takes only a handful of values"""
+    return _json_dumps({'analysis_period': analysis_period})
+
+# HTTP/2 needs the optional h2 package (pip install httpx[http2])
+_HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+# Async clients are bound to the event loop they were created on, so keep one per loop
+_ASYNC_CLIENTS: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[tuple, Any]]" = \
+    weakref.WeakKeyDictionary()
+
+_RETRY_STATUSES = [429, 500, 502, 503, 504]
+# Only these are retried on error statuses; a POST may already have been acted on
+_IDEMPOTENT_METHODS = ["HEAD", "GET", "OPTIONS"]
+
+# requests sessions shared by every tool talking to the same server
+_SESSION_REGISTRY: Dict[tuple, requests.Session] = {}
+_SESSION_LOCK = threading.Lock()
+
+# Servers that answered 404 on the financial summary batch endpoint
+_BATCH_UNSUPPORTED: set = set()
+_SUMMARY_BATCH_SIZE = 500
+
+# Runs independent blocking tool calls side by side
+_TOOL_EXECUTOR = ThreadPoolExecutor(max_workers=8, thread_name_prefix="mcp-tools")
+
+# GET requests in flight, so concurrent callers for the same URL share one round trip
+_SYNC_INFLIGHT: Dict[str, Future] = {}
+_SYNC_INFLIGHT_LOCK = threading.Lock()
+_ASYNC_INFLIGHT: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[str, asyncio.Task]]" = \
+    weakref.WeakKeyDictionary()
+
+_SYNC_LOOP: Optional[asyncio.AbstractEventLoop] = None
+_SYNC_LOOP_LOCK = threading.Lock()
+
+def _run_sync(coro):
+    """Run a coroutine from synchronous code on the tools' background event loop"""
+    global _SYNC_LOOP
+    with _SYNC_LOOP_LOCK:
+        if _SYNC_LOOP is None:
+            # A long-lived loop keeps its async clients, and their keep-alive connections, across calls
+            _SYNC_LOOP = asyncio.new_event_loop()
+            threading.Thread(target=_SYNC_LOOP.run_forever, name="mcp-tools-loop", daemon=True).start()
+    return asyncio.run_coroutine_threadsafe(coro, _SYNC_LOOP).result()
+
+@dataclass(slots=True)
 class ToolResult:
     """Result from tool execution"""
     success: bool
@@ -33,10 +115,12 @@ class ToolResult:
     error: Optional[str] = None
     execution_time: float = 0.0
     retry_count: int = 0
-    timestamp: datetime = field(default_factory=datetime.now)
+    timestamp: float = field(default_factory=time.time)  # epoch seconds; format when serializing
 
 class MCPToolConfig(BaseModel):
     """Configuration for MCP tools"""
+    model_config = ConfigDict(frozen=True, extra='forbid')
+    
     base_url: str
     timeout: int = 30
     max_retries: int = 3
@@ -44,18 +128,220 @@ class MCPToolConfig(BaseModel):
     retry_backoff: float = 2.0
     enable_logging: bool = True
     
-    @validator('base_url')
+    @field_validator('base_url')
+    @classmethod
     def validate_base_url(cls, v):
         if not v.startswith(('http://', 'https://')):
             raise ValueError('base_url must start with http:// or https://')
         return v.rstrip('/')
 
+# Response schemas; only presence and type are checked, the raw dict is what callers receive
+class CustomerResponse(BaseModel):
+    """Customer details returned by the Customer MCP server"""
+    model_config = ConfigDict(extra='allow', coerce_numbers_to_str=True)
+    
+    customer_id: str
+    name: Optional[str]
+    email: Optional[str]
+    annual_income: Optional[float]
+
+class FinancialSummaryResponse(BaseModel):
+    """Customer financial summary returned by the Customer MCP server"""
+    model_config = ConfigDict(extra='allow', coerce_numbers_to_str=True)
+    
+    customer_id: str
+    credit_score: Optional[float]
+    net_worth: Optional[float]
+    total_assets: Optional[float]
+
+class MarketDataResponse(BaseModel):
+    """Current market conditions returned by the Market MCP server"""
+    model_config = ConfigDict(extra='allow')
+    
+    current_rates: Any
+    market_volatility: Any
+    economic_health: Any
+
+class BenchmarkResponse(BaseModel):
+    """Risk-adjusted benchmark returned by the Market MCP server"""
+    model_config = ConfigDict(extra='allow', coerce_numbers_to_str=True)
+    
+    loan_type: str
+    risk_score: Optional[float]
+    benchmark_rate: Optional[float]
+    total_rate: Optional[float]
+
+class _ToolRetry(Retry):
+    """Retry policy that gives POST requests a single retry, on connection errors only
+
+    allowed_methods already keeps POSTs out of status and read retries, which
+    could repeat a request the server has acted on; this caps connect retries.
+    """
+    
+    def increment(self, method=None, url=None, response=None, error=None, _pool=None, _stacktrace=None):
+        if method and method.upper() == 'POST' and self.history:
+            raise MaxRetryError(_pool, url, error)
+        return super().increment(method, url, response, error, _pool, _stacktrace)
+
+class _ToolHTTPAdapter(HTTPAdapter):
+    """HTTPAdapter whose sockets disable Nagle's algorithm and use TCP keep-alive"""
+    
+    def init_poolmanager(self, *args, **kwargs):
+        kwargs['socket_options'] = HTTPConnection.default_socket_options + [
+            (socket.IPPROTO_TCP, socket.TCP_NODELAY, 1),
+            (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+        ]
+        super().init_poolmanager(*args, **kwargs)
+
+def _get_session(config: MCPToolConfig) -> requests.Session:
+    """Shared keep-alive session for the config's server and retry settings"""
+    parsed = urlparse(config.base_url)
+    key = (parsed.scheme, parsed.hostname, parsed.port, config.max_retries, config.retry_backoff)
+    with _SESSION_LOCK:
+        session = _SESSION_REGISTRY.get(key)
+        if session is None:
+            session = requests.Session()
+            
+            # Configure retry strategy
+            retry_strategy = _ToolRetry(
+                total=config.max_retries,
+                status_forcelist=_RETRY_STATUSES,
+                allowed_methods=_IDEMPOTENT_METHODS,
+                backoff_factor=config.retry_backoff,
+                respect_retry_after_header=True
+            )
+            
+            adapter = _ToolHTTPAdapter(pool_connections=20, pool_maxsize=100, max_retries=retry_strategy)
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+            _SESSION_REGISTRY[key] = session
+    return session
+
+class _HttpxClient:
+    """Async client backed by httpx (HTTP/2 when h2 is installed)"""
+    
+    timeout_errors = (httpx.TimeoutException,)
+    connection_errors = (httpx.TransportError,)
+    request_errors = (httpx.HTTPError,)
+    
+    def __init__(self, config: MCPToolConfig):
+        # The transport retries connection failures; _arequest retries retryable HTTP statuses
+        transport = httpx.AsyncHTTPTransport(
+            http2=_HTTP2_AVAILABLE,
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=50),
+            retries=config.max_retries
+        )
+        self._client = httpx.AsyncClient(
+            base_url=config.base_url,
+            timeout=config.timeout,
+            headers={'Content-Type': 'application/json', 'Accept': 'application/json'},
+            transport=transport
+        )
+    
+    async def send(self, method: str, endpoint: str, body: Optional[bytes],
+                   headers: Optional[Dict]) -> tuple:
+        """Send a request and return (status, headers, content)"""
+        response = await self._client.request(method, endpoint, content=body, headers=headers)
+        return response.status_code, response.headers, response.content
+    
+    async def close(self):
+        await self._client.aclose()
+
+class _AiohttpClient:
+    """Async client backed by aiohttp, which holds up better than httpx at high concurrency"""
+    
+    timeout_errors = (asyncio.TimeoutError,)
+    connection_errors = (aiohttp.ClientConnectionError,) if aiohttp else ()
+    request_errors = (aiohttp.ClientError,) if aiohttp else ()
+    
+    def __init__(self, config: MCPToolConfig):
+        self._base_url = config.base_url
+        self._connect_retries = config.max_retries
+        self._session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=100, limit_per_host=50, ttl_dns_cache=300,
+                                           keepalive_timeout=30),
+            timeout=aiohttp.ClientTimeout(total=config.timeout),
+            headers={'Content-Type': 'application/json', 'Accept': 'application/json'}
+        )
+    
+    async def send(self, method: str, endpoint: str, body: Optional[bytes],
+                   headers: Optional[Dict]) -> tuple:
+        """Send a request and return (status, headers, content)"""
+        for attempt in range(self._connect_retries + 1):
+            try:
+                async with self._session.request(method, f"{self._base_url}{endpoint}",
+                                                 data=body, headers=headers) as response:
+                    return response.status, response.headers, await response.read()
+            except aiohttp.ClientConnectorError:
+                # Nothing reached the server, so any method is safe to retry
+                if attempt == self._connect_retries:
+                    raise
+    
+    async def close(self):
+        await self._session.close()
+
+def _get_async_client(config: MCPToolConfig):
+    """Shared async client for the config's server on the running event loop"""
+    clients = _ASYNC_CLIENTS.setdefault(asyncio.get_running_loop(), {})
+    key = (config.base_url, config.timeout, config.max_retries)
+    client = clients.get(key)
+    if client is None:
+        client = clients[key] = _AiohttpClient(config) if aiohttp is not None else _HttpxClient(config)
+    return client
+
+async def close_async_clients():
+    """Close the async clients created on the running event loop"""
+    clients = _ASYNC_CLIENTS.pop(asyncio.get_running_loop(), {})
+    for client in clients.values():
+        await client.close()
+
+class _ResponseCache:
+    """Short-lived cache of successful responses, shared by all tools"""
+    
+    def __init__(self, ttl: float = 5.0, maxsize: int = 32):
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._entries: Dict[str, tuple] = {}  # key -> (expires_at, data)
+        self._lock = threading.Lock()
+    
+    def get(self, key: str) -> Optional[ToolResult]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry[0] <= time.monotonic():
+                del self._entries[key]
+                return None
+            data = entry[1]
+        return ToolResult(success=True, data=copy.copy(data))
+    
+    def set(self, key: str, result: ToolResult):
+        if not result.success:
+            return
+        with self._lock:
+            if len(self._entries) >= self.maxsize and key not in self._entries:
+                self._entries.clear()
+            self._entries[key] = (time.monotonic() + self.ttl, copy.copy(result.data))
+    
+    def invalidate(self, prefix: str = ""):
+        with self._lock:
+            for key in [k for k in self._entries if k.startswith(prefix)]:
+                del self._entries[key]
+
+# Market data changes slowly; any GET is memoized briefly to absorb request bursts
+_MARKET_CACHE = _ResponseCache()
+_GET_CACHE = _ResponseCache(ttl=2.0, maxsize=1024)
+
+def _copy_result(result: ToolResult) -> ToolResult:
+    """Copy of a shared result that a caller can enrich without affecting other callers"""
+    return replace(result, data=copy.copy(result.data))
+
 class BaseMCPTool:
     """Base class for MCP communication tools"""
     
     def __init__(self, config: MCPToolConfig):
         self.config = config
-        self.session = self._create_session()
+        self.session = _get_session(config)
         self.logger = logging.getLogger(f"{self.__class__.__name__}")
         
         if config.enable_logging:
@@ -63,27 +349,43 @@ class BaseMCPTool:
         else:
             self.logger.setLevel(logging.WARNING)
     
-    def _create_session(self) -> requests.Session:
-        """Create HTTP session with retry configuration"""
-        session = requests.Session()
-        
-        # Configure retry strategy
-        retry_strategy = Retry(
-            total=self.config.max_retries,
-            status_forcelist=[429, 500, 502, 503, 504],
-            allowed_methods=["HEAD", "GET", "OPTIONS", "POST"],
-            backoff_factor=self.config.retry_backoff
-        )
-        
-        adapter = HTTPAdapter(max_retries=retry_strategy)
-        session.mount("http://", adapter)
-        session.mount("https://", adapter)
-        
-        return session
-    
     def _make_request(self, method: str, endpoint: str, 
                      data: Optional[Dict] = None, 
-                     headers: Optional[Dict] = None) -> ToolResult:
+                     headers: Optional[Dict] = None,
+                     raw_body: Optional[bytes] = None) -> ToolResult:
+        """Make HTTP request, sharing identical GETs that are cached or already in flight"""
+        if method.upper() != 'GET' or headers:
+            return self._send_request(method, endpoint, data, headers, raw_body)
+        
+        key = f"{self.config.base_url}{endpoint}"
+        cached = _GET_CACHE.get(key)
+        if cached is not None:
+            return cached
+        
+        with _SYNC_INFLIGHT_LOCK:
+            future = _SYNC_INFLIGHT.get(key)
+            leader = future is None
+            if leader:
+                future = _SYNC_INFLIGHT[key] = Future()
+        if not leader:
+            return _copy_result(future.result())
+        
+        try:
+            result = self._send_request(method, endpoint)
+            _GET_CACHE.set(key, result)
+            future.set_result(result)
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        finally:
+            with _SYNC_INFLIGHT_LOCK:
+                _SYNC_INFLIGHT.pop(key, None)
+        return _copy_result(result)
+    
+    def _send_request(self, method: str, endpoint: str, 
+                      data: Optional[Dict] = None, 
+                      headers: Optional[Dict] = None,
+                      raw_body: Optional[bytes] = None) -> ToolResult:
         """Make HTTP request with error handling and retries"""
         start_time = time.time()
         url = f"{self.config.base_url}{endpoint}"
@@ -101,7 +403,8 @@ class BaseMCPTool:
             if method.upper() == 'GET':
                 response = self.session.get(url, headers=default_headers, timeout=self.config.timeout)
             elif method.upper() == 'POST':
-                response = self.session.post(url, json=data, headers=default_headers, timeout=self.config.timeout)
+                body = raw_body if raw_body is not None else (_json_dumps(data) if data is not None else None)
+                response = self.session.post(url, data=body, headers=default_headers, timeout=self.config.timeout)
             else:
                 raise ValueError(f"Unsupported HTTP method: {method}")
             
@@ -111,7 +414,7 @@ class BaseMCPTool:
                 self.logger.info(f"Request successful in {execution_time:.3f}s")
                 return ToolResult(
                     success=True,
-                    data=response.json(),
+                    data=_json_loads(response.content),
                     execution_time=execution_time
                 )
             else:
@@ -159,10 +462,114 @@ class BaseMCPTool:
                 execution_time=time.time() - start_time
             )
     
+    async def _arequest(self, method: str, endpoint: str,
+                        data: Optional[Dict] = None,
+                        headers: Optional[Dict] = None) -> ToolResult:
+        """Async counterpart of _make_request, sharing identical GETs that are cached or in flight"""
+        if method.upper() != 'GET' or headers:
+            return await self._asend_request(method, endpoint, data, headers)
+        
+        key = f"{self.config.base_url}{endpoint}"
+        cached = _GET_CACHE.get(key)
+        if cached is not None:
+            return cached
+        
+        inflight = _ASYNC_INFLIGHT.setdefault(asyncio.get_running_loop(), {})
+        task = inflight.get(key)
+        if task is None:
+            task = inflight[key] = asyncio.ensure_future(self._asend_request(method, endpoint))
+            task.add_done_callback(lambda _: inflight.pop(key, None))
+        
+        # Shielded so one caller being cancelled does not fail the others
+        result = await asyncio.shield(task)
+        _GET_CACHE.set(key, result)
+        return _copy_result(result)
+    
+    async def _asend_request(self, method: str, endpoint: str,
+                             data: Optional[Dict] = None,
+                             headers: Optional[Dict] = None) -> ToolResult:
+        """Send a request on the shared aiohttp or httpx client"""
+        start_time = time.time()
+        client = _get_async_client(self.config)
+        
+        try:
+            self.logger.info(f"Making async {method} request to {self.config.base_url}{endpoint}")
+            
+            if method.upper() not in ('GET', 'POST'):
+                raise ValueError(f"Unsupported HTTP method: {method}")
+            body = _json_dumps(data) if data is not None and method.upper() == 'POST' else None
+            
+            for attempt in range(self.config.max_retries + 1):
+                status, response_headers, content = await client.send(method.upper(), endpoint, body, headers)
+                if (status not in _RETRY_STATUSES or method.upper() not in _IDEMPOTENT_METHODS
+                        or attempt == self.config.max_retries):
+                    break
+                
+                # Honour Retry-After, otherwise back off with full jitter
+                retry_after = response_headers.get('Retry-After', '')
+                if retry_after.isdigit():
+                    sleep_time = float(retry_after)
+                else:
+                    sleep_time = random.uniform(0, self.config.retry_delay * (self.config.retry_backoff ** attempt))
+                self.logger.warning(f"HTTP {status} from {endpoint}, retrying in {sleep_time:.1f}s")
+                await asyncio.sleep(sleep_time)
+            
+            execution_time = time.time() - start_time
+            
+            if status == 200:
+                self.logger.info(f"Request successful in {execution_time:.3f}s")
+                return ToolResult(
+                    success=True,
+                    data=_json_loads(content),
+                    execution_time=execution_time
+                )
+            else:
+                error_msg = f"HTTP {status}: {content.decode(errors='replace')}"
+                self.logger.error(f"Request failed: {error_msg}")
+                return ToolResult(
+                    success=False,
+                    error=error_msg,
+                    execution_time=execution_time
+                )
+        
+        except client.timeout_errors:
+            error_msg = f"Request timeout after {self.config.timeout}s"
+        except client.connection_errors as e:
+            error_msg = f"Connection error: {str(e)}"
+        except client.request_errors as e:
+            error_msg = f"Request error: {str(e)}"
+        except Exception as e:
+            error_msg = f"Unexpected error: {str(e)}"
+        
+        self.logger.error(error_msg)
+        return ToolResult(
+            success=False,
+            error=error_msg,
+            execution_time=time.time() - start_time
+        )
+    
+    def _require_fields(self, result: ToolResult, expected_fields: List[str], error: str) -> ToolResult:
+        """Mark a successful result as failed if it lacks the expected fields"""
+        if result.success and not self.validate_response(result, expected_fields):
+            result.success = False
+            result.error = error
+        return result
+    
     def health_check(self) -> ToolResult:
         """Check if the MCP server is healthy"""
         return self._make_request('GET', '/health')
     
+    def _require_model(self, result: ToolResult, model: type, error: str) -> ToolResult:
+        """Mark a successful result as failed if its data does not match the response model"""
+        if result.success:
+            try:
+                model.model_validate(result.data)
+            except ValidationError as e:
+                self.logger.error(f"{error}: {e}")
+                result.success = False
+                result.error = f"{error}: {e.error_count()} invalid field(s)"
+        return result
+    
     def validate_response(self, result: ToolResult, expected_fields: Optional[List[str]] = None) -> bool:
         """Validate tool result"""
         if not result.success:
@@ -183,30 +590,23 @@ class BaseMCPTool:
 class CustomerDataTool(BaseMCPTool):
     """Tool for interacting with Customer MCP server"""
     
+    
     def get_customer(self, customer_id: str) -> ToolResult:
         """Get customer details by ID"""
         self.logger.info(f"Fetching customer: {customer_id}")
         
         result = self._make_request('GET', f'/customers/{customer_id}')
         
-        if result.success:
-            expected_fields = ['customer_id', 'name', 'email', 'annual_income']
-            if not self.validate_response(result, expected_fields):
-                result.success = False
-                result.error = "Invalid customer data format"
-        
-        return result
+        return self._require_model(result, CustomerResponse, "Invalid customer data format")
     
     def search_customers(self, filters: Dict[str, Any], 
                         limit: int = 100, offset: int = 0) -> ToolResult:
         """Search customers with filters"""
         self.logger.info(f"Searching customers with filters: {filters}")
         
-        search_data = {
-            **filters,
-            'limit': min(limit, 1000),  # Cap at 1000
-            'offset': offset
-        }
+        search_data = filters.copy()
+        search_data['limit'] = min(limit, 1000)  # Cap at 1000
+        search_data['offset'] = offset
         
         result = self._make_request('POST', '/customers/search', data=search_data)
         
@@ -223,14 +623,70 @@ class CustomerDataTool(BaseMCPTool):
         self.logger.info(f"Fetching financial summary for customer: {customer_id}")
         
         result = self._make_request('GET', f'/customers/{customer_id}/financial-summary')
+        return self._require_model(result, FinancialSummaryResponse, "Invalid financial summary format")
+    
+    async def aget_financial_summary(self, customer_id: str) -> ToolResult:
+        """Get customer financial summary without blocking the event loop"""
+        self.logger.info(f"Fetching financial summary for customer: {customer_id}")
         
-        if result.success:
-            expected_fields = ['customer_id', 'credit_score', 'net_worth', 'total_assets']
-            if not self.validate_response(result, expected_fields):
-                result.success = False
-                result.error = "Invalid financial summary format"
+        result = await self._arequest('GET', f'/customers/{customer_id}/financial-summary')
+        return self._require_model(result, FinancialSummaryResponse, "Invalid financial summary format")
+    
+    def get_financial_summary_batch(self, customer_ids: List[str]) -> ToolResult:
+        """Get financial summaries for several customers in one request"""
+        self.logger.info(f"Fetching financial summaries for {len(customer_ids)} customers")
         
-        return result
+        result = self._make_request('POST', '/customers/financial-summary/batch',
+                                    data={'customer_ids': list(customer_ids)})
+        return self._require_fields(result, ['summaries'], "Invalid financial summary batch format")
+    
+    async def aget_financial_summaries(self, customer_ids: List[str]) -> Dict[str, ToolResult]:
+        """Get financial summaries keyed by customer ID, batching requests where the server allows"""
+        customer_ids = list(dict.fromkeys(customer_ids))
+        
+        if self.config.base_url not in _BATCH_UNSUPPORTED:
+            chunks = [customer_ids[i:i + _SUMMARY_BATCH_SIZE]
+                      for i in range(0, len(customer_ids), _SUMMARY_BATCH_SIZE)]
+            batch_results = await asyncio.gather(*(
+                self._arequest('POST', '/customers/financial-summary/batch', data={'customer_ids': chunk})
+                for chunk in chunks
+            ))
+            
+            if not any(r.error and r.error.startswith("HTTP 404") for r in batch_results):
+                summaries = {}
+                for chunk, batch_result in zip(chunks, batch_results):
+                    summaries.update(self._split_summary_batch(chunk, batch_result))
+                return summaries
+            
+            self.logger.warning(f"Batch endpoint not available on {self.config.base_url}, "
+                                f"falling back to per-customer requests")
+            _BATCH_UNSUPPORTED.add(self.config.base_url)
+        
+        results = await asyncio.gather(*(self.aget_financial_summary(cid) for cid in customer_ids))
+        return dict(zip(customer_ids, results))
+    
+    def _split_summary_batch(self, customer_ids: List[str], batch_result: ToolResult) -> Dict[str, ToolResult]:
+        """Turn one batch response into per-customer results"""
+        self._require_fields(batch_result, ['summaries'], "Invalid financial summary batch format")
+        if not batch_result.success:
+            return {cid: replace(batch_result) for cid in customer_ids}
+        
+        summaries = {
+            summary.get('customer_id'): summary
+            for summary in batch_result.data['summaries'] if isinstance(summary, dict)
+        }
+        results = {}
+        for cid in customer_ids:
+            summary = summaries.get(cid)
+            if summary is None:
+                results[cid] = ToolResult(success=False, error=f"No financial summary for customer {cid}",
+                                          execution_time=batch_result.execution_time)
+            else:
+                results[cid] = self._require_model(
+                    ToolResult(success=True, data=summary, execution_time=batch_result.execution_time),
+                    FinancialSummaryResponse, "Invalid financial summary format"
+                )
+        return results
     
     def get_customer_stats(self) -> ToolResult:
         """Get customer statistics"""
@@ -272,41 +728,88 @@ class CustomerDataTool(BaseMCPTool):
         }
         return self.search_customers(filters, limit)
 
-class CreditDataTool(BaseMCPTool):
+# Credit score bands: a score at or above a threshold falls in the next band up
+_SCORE_THRESHOLDS = (600, 650, 700, 750)
+_SCORE_LEVELS = ('Very Poor', 'Poor', 'Fair', 'Good', 'Excellent')
+_SCORE_APPROVAL = (0.25, 0.50, 0.70, 0.85, 0.95)
+# risk_distribution key for each band
+_RISK_DISTRIBUTION_KEYS = ('very_poor', 'poor', 'fair', 'good', 'excellent')
+
+class _SummaryLoader:
+    """Coalesces financial summary lookups made within a short window into batch requests"""
+    
+    def __init__(self, customer_tool: CustomerDataTool, window: float = 0.005):
+        self.customer_tool = customer_tool
+        self.window = window
+        self._pending: Dict[str, List[asyncio.Future]] = {}
+        self._flush_task: Optional[asyncio.Task] = None
+    
+    async def load(self, customer_id: str) -> ToolResult:
+        """Wait for the customer's summary from the next batch"""
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.setdefault(customer_id, []).append(future)
+        if self._flush_task is None:
+            self._flush_task = loop.create_task(self._flush())
+        return await future
+    
+    async def _flush(self):
+        await asyncio.sleep(self.window)
+        pending, self._pending = self._pending, {}
+        self._flush_task = None
+        
+        try:
+            results = await self.customer_tool.aget_financial_summaries(list(pending))
+        except Exception as e:
+            results = {cid: ToolResult(success=False, error=f"Unexpected error: {str(e)}") for cid in pending}
+        
+        for customer_id, futures in pending.items():
+            for future in futures:
+                if not future.done():
+                    # Each waiter gets its own result object to enrich
+                    future.set_result(replace(results[customer_id]))
+
+class CreditDataTool(CustomerDataTool):
     """Tool for credit-related operations (extends CustomerDataTool)"""
     
     def __init__(self, config: MCPToolConfig):
         super().__init__(config)
-        self.customer_tool = CustomerDataTool(config)
+        # One summary loader per event loop, since its futures belong to that loop
+        self._summary_loaders: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, _SummaryLoader]" = \
+            weakref.WeakKeyDictionary()
     
     def get_credit_profile(self, customer_id: str) -> ToolResult:
         """Get comprehensive credit profile for customer"""
         self.logger.info(f"Fetching credit profile for customer: {customer_id}")
         
         # Get financial summary which includes credit data
-        result = self.customer_tool.get_financial_summary(customer_id)
+        result = self.get_financial_summary(customer_id)
+        return self._enrich_credit_profile(result)
+    
+    async def aget_credit_profile(self, customer_id: str) -> ToolResult:
+        """Get comprehensive credit profile for customer without blocking the event loop"""
+        self.logger.info(f"Fetching credit profile for customer: {customer_id}")
+        
+        loop = asyncio.get_running_loop()
+        loader = self._summary_loaders.get(loop)
+        if loader is None:
+            loader = self._summary_loaders[loop] = _SummaryLoader(self)
         
+        # Concurrent profile lookups are coalesced into one batch request
+        result = await loader.load(customer_id)
+        return self._enrich_credit_profile(result)
+    
+    def _enrich_credit_profile(self, result: ToolResult) -> ToolResult:
+        """Add credit risk and utilization analysis to a financial summary result"""
         if result.success:
             # Enhance with additional credit analysis
             credit_data = result.data
             credit_score = credit_data.get('credit_score', 0)
             
             # Add credit risk assessment
-            if credit_score >= 750:
-                risk_level = "Excellent"
-                approval_probability = 0.95
-            elif credit_score >= 700:
-                risk_level = "Good"
-                approval_probability = 0.85
-            elif credit_score >= 650:
-                risk_level = "Fair"
-                approval_probability = 0.70
-            elif credit_score >= 600:
-                risk_level = "Poor"
-                approval_probability = 0.50
-            else:
-                risk_level = "Very Poor"
-                approval_probability = 0.25
+            band = bisect.bisect_right(_SCORE_THRESHOLDS, credit_score)
+            risk_level = _SCORE_LEVELS[band]
+            approval_probability = _SCORE_APPROVAL[band]
             
             # Add credit utilization analysis
             credit_utilization = credit_data.get('credit_utilization', 0)
@@ -332,13 +835,19 @@ class CreditDataTool(BaseMCPTool):
     
     def analyze_credit_trends(self, customer_ids: List[str]) -> ToolResult:
         """Analyze credit trends across multiple customers"""
+        return _run_sync(self.aanalyze_credit_trends(customer_ids))
+    
+    async def aanalyze_credit_trends(self, customer_ids: List[str]) -> ToolResult:
+        """Analyze credit trends across multiple customers, fetching profiles concurrently"""
         self.logger.info(f"Analyzing credit trends for {len(customer_ids)} customers")
         
+        summaries = await self.aget_financial_summaries(customer_ids)
+        
         credit_profiles = []
         failed_customers = []
         
         for customer_id in customer_ids:
-            result = self.get_credit_profile(customer_id)
+            result = summaries[customer_id]
             if result.success:
                 credit_profiles.append(result.data)
             else:
@@ -350,39 +859,43 @@ class CreditDataTool(BaseMCPTool):
                 error="No valid credit profiles found"
             )
         
-        # Calculate aggregate statistics
-        credit_scores = [p.get('credit_score', 0) for p in credit_profiles]
-        net_worths = [p.get('net_worth', 0) for p in credit_profiles]
-        utilization_rates = [p.get('credit_utilization', 0) for p in credit_profiles]
+        # NumPy is only needed here, so callers that never analyze trends skip its import
+        import numpy as np
+        
+        # Calculate aggregate statistics over columnar arrays built in one pass each
+        count = len(credit_profiles)
+        credit_scores = np.fromiter((p.get('credit_score', 0) for p in credit_profiles), dtype=np.float64, count=count)
+        net_worths = np.fromiter((p.get('net_worth', 0) for p in credit_profiles), dtype=np.float64, count=count)
+        utilization_rates = np.fromiter((p.get('credit_utilization', 0) for p in credit_profiles),
+                                        dtype=np.float64, count=count)
+        
+        # Band every score at once rather than enriching each profile
+        band_counts = np.bincount(np.searchsorted(np.array(_SCORE_THRESHOLDS), credit_scores, side='right'),
+                                  minlength=len(_SCORE_LEVELS))
         
         analysis = {
-            'total_customers': len(credit_profiles),
+            'total_customers': count,
             'failed_customers': failed_customers,
             'credit_score_stats': {
-                'mean': np.mean(credit_scores),
+                'mean': credit_scores.mean(),
                 'median': np.median(credit_scores),
-                'min': min(credit_scores),
-                'max': max(credit_scores),
-                'std': np.std(credit_scores)
+                'min': credit_scores.min().item(),
+                'max': credit_scores.max().item(),
+                'std': credit_scores.std()
             },
             'net_worth_stats': {
-                'mean': np.mean(net_worths),
+                'mean': net_worths.mean(),
                 'median': np.median(net_worths),
-                'min': min(net_worths),
-                'max': max(net_worths)
+                'min': net_worths.min().item(),
+                'max': net_worths.max().item()
             },
             'utilization_stats': {
-                'mean': np.mean(utilization_rates),
+                'mean': utilization_rates.mean(),
                 'median': np.median(utilization_rates),
-                'high_risk_count': sum(1 for u in utilization_rates if u > 0.8)
+                'high_risk_count': int((utilization_rates > 0.8).sum())
             },
-            'risk_distribution': {
-                'excellent': sum(1 for p in credit_profiles if p.get('credit_risk_level') == 'Excellent'),
-                'good': sum(1 for p in credit_profiles if p.get('credit_risk_level') == 'Good'),
-                'fair': sum(1 for p in credit_profiles if p.get('credit_risk_level') == 'Fair'),
-                'poor': sum(1 for p in credit_profiles if p.get('credit_risk_level') == 'Poor'),
-                'very_poor': sum(1 for p in credit_profiles if p.get('credit_risk_level') == 'Very Poor')
-            }
+            # Best band first
+            'risk_distribution': dict(zip(_RISK_DISTRIBUTION_KEYS[::-1], band_counts[::-1].tolist()))
         }
         
         return ToolResult(
@@ -395,21 +908,45 @@ class MarketDataTool(BaseMCPTool):
     
     def get_current_market_data(self) -> ToolResult:
         """Get current market conditions"""
+        cache_key = f"{self.config.base_url}/market/current"
+        cached = _MARKET_CACHE.get(cache_key)
+        if cached is not None:
+            return cached
+        
         self.logger.info("Fetching current market data")
         
         result = self._make_request('GET', '/market/current')
+        result = self._require_model(result, MarketDataResponse, "Invalid market data format")
+        _MARKET_CACHE.set(cache_key, result)
+        return result
+    
+    async def aget_current_market_data(self) -> ToolResult:
+        """Get current market conditions without blocking the event loop"""
+        cache_key = f"{self.config.base_url}/market/current"
+        cached = _MARKET_CACHE.get(cache_key)
+        if cached is not None:
+            return cached
         
-        if result.success:
-            expected_fields = ['current_rates', 'market_volatility', 'economic_health']
-            if not self.validate_response(result, expected_fields):
-                result.success = False
-                result.error = "Invalid market data format"
+        self.logger.info("Fetching current market data")
         
+        result = await self._arequest('GET', '/market/current')
+        result = self._require_model(result, MarketDataResponse, "Invalid market data format")
+        _MARKET_CACHE.set(cache_key, result)
         return result
     
+    def refresh_market(self):
+        """Drop cached market data for this server so the next call refetches it"""
+        _MARKET_CACHE.invalidate(f"{self.config.base_url}/")
+        _GET_CACHE.invalidate(f"{self.config.base_url}/")
+    
     def get_historical_market_data(self, start_date: str, end_date: str, 
-                                 indicators: Optional[List[str]] = None) -> ToolResult:
-        """Get historical market data"""
+                                 indicators: Optional[List[str]] = None,
+                                 yield_records: bool = False) -> ToolResult:
+        """Get historical market data
+        
+        With yield_records, result.data is an iterator over the records, parsed
+        from the response stream as they are consumed.
+        """
         self.logger.info(f"Fetching historical market data from {start_date} to {end_date}")
         
         data = {
@@ -419,15 +956,64 @@ class MarketDataTool(BaseMCPTool):
         if indicators:
             data['indicators'] = list(indicators)
         
+        if ijson is not None:
+            result = self._stream_json_array('/market/historical', data)
+            if result.success and not yield_records:
+                result.data = list(result.data)
+            return result
+        
         result = self._make_request('POST', '/market/historical', data=data)
         
         if result.success:
             if not isinstance(result.data, list):
                 result.success = False
                 result.error = "Historical data should be a list"
+            elif yield_records:
+                result.data = iter(result.data)
         
         return result
     
+    def _stream_json_array(self, endpoint: str, data: Dict[str, Any]) -> ToolResult:
+        """POST and parse a JSON array response record by record instead of loading it whole"""
+        start_time = time.time()
+        url = f"{self.config.base_url}{endpoint}"
+        
+        try:
+            response = self.session.post(
+                url, data=_json_dumps(data), stream=True, timeout=self.config.timeout,
+                headers={'Content-Type': 'application/json', 'Accept': 'application/json'}
+            )
+            if response.status_code != 200:
+                error_msg = f"HTTP {response.status_code}: {response.text}"
+                self.logger.error(f"Request failed: {error_msg}")
+                return ToolResult(success=False, error=error_msg, execution_time=time.time() - start_time)
+            
+            response.raw.decode_content = True
+            events = ijson.parse(response.raw, use_float=True)
+            first_event = next(events, None)
+            if first_event is None or first_event[1] != 'start_array':
+                response.close()
+                return ToolResult(success=False, error="Historical data should be a list",
+                                  execution_time=time.time() - start_time)
+            
+            def records():
+                with response:
+                    yield from ijson.items(itertools.chain([first_event], events), 'item')
+            
+            return ToolResult(success=True, data=records(), execution_time=time.time() - start_time)
+        
+        except requests.exceptions.Timeout:
+            error_msg = f"Request timeout after {self.config.timeout}s"
+        except requests.exceptions.ConnectionError as e:
+            error_msg = f"Connection error: {str(e)}"
+        except requests.exceptions.RequestException as e:
+            error_msg = f"Request error: {str(e)}"
+        except Exception as e:
+            error_msg = f"Unexpected error: {str(e)}"
+        
+        self.logger.error(error_msg)
+        return ToolResult(success=False, error=error_msg, execution_time=time.time() - start_time)
+    
     def calculate_risk_benchmark(self, loan_type: str, risk_score: int, 
                                loan_amount: float, term_months: int,
                                collateral_value: Optional[float] = None) -> ToolResult:
@@ -445,23 +1031,13 @@ class MarketDataTool(BaseMCPTool):
         
         result = self._make_request('POST', '/risk/benchmark', data=data)
         
-        if result.success:
-            expected_fields = ['loan_type', 'risk_score', 'benchmark_rate', 'total_rate']
-            if not self.validate_response(result, expected_fields):
-                result.success = False
-                result.error = "Invalid benchmark response format"
-        
-        return result
+        return self._require_model(result, BenchmarkResponse, "Invalid benchmark response format")
     
     def analyze_economic_cycle(self, analysis_period: str = "12m") -> ToolResult:
         """Analyze current economic cycle"""
         self.logger.info(f"Analyzing economic cycle for {analysis_period}")
         
-        data = {
-            'analysis_period': analysis_period
-        }
-        
-        result = self._make_request('POST', '/economic/cycle', data=data)
+        result = self._make_request('POST', '/economic/cycle', raw_body=_economic_cycle_body(analysis_period))
         
         if result.success:
             expected_fields = ['current_phase', 'confidence_score', 'indicators']
@@ -516,8 +1092,9 @@ class AgentToolManager:
     """Manager for coordinating multiple MCP tools"""
     
     def __init__(self, customer_config: MCPToolConfig, market_config: MCPToolConfig):
-        self.customer_tool = CustomerDataTool(customer_config)
+        # The credit tool is a customer tool, so one instance serves both roles
         self.credit_tool = CreditDataTool(customer_config)
+        self.customer_tool = self.credit_tool
         self.market_tool = MarketDataTool(market_config)
         self.logger = logging.getLogger("AgentToolManager")
     
@@ -539,14 +1116,13 @@ class AgentToolManager:
         """Get customer data with current market context"""
         self.logger.info(f"Getting customer {customer_id} with market context")
         
-        # Get customer data
+        # Customer and market data are independent, so fetch them in parallel
+        market_future = _TOOL_EXECUTOR.submit(self.market_tool.get_current_market_data)
         customer_result = self.customer_tool.get_customer(customer_id)
+        market_result = market_future.result()
         if not customer_result.success:
             return customer_result
         
-        # Get market data
-        market_result = self.market_tool.get_current_market_data()
-        
         # Combine results
         combined_data = {
             'customer': customer_result.data,
@@ -558,7 +1134,7 @@ class AgentToolManager:
         return ToolResult(
             success=True,
             data=combined_data,
-            execution_time=customer_result.execution_time + market_result.execution_time
+            execution_time=max(customer_result.execution_time, market_result.execution_time)
         )
     
     def calculate_loan_terms(self, customer_id: str, loan_type: str, 
@@ -603,16 +1179,19 @@ class AgentToolManager:
     
     def analyze_portfolio_risk(self, customer_ids: List[str]) -> ToolResult:
         """Analyze portfolio risk across multiple customers"""
+        return _run_sync(self.aanalyze_portfolio_risk(customer_ids))
+    
+    async def aanalyze_portfolio_risk(self, customer_ids: List[str]) -> ToolResult:
+        """Analyze portfolio risk, fetching credit trends and market conditions concurrently"""
         self.logger.info(f"Analyzing portfolio risk for {len(customer_ids)} customers")
         
-        # Get credit trends
-        credit_result = self.credit_tool.analyze_credit_trends(customer_ids)
+        credit_result, market_result = await asyncio.gather(
+            self.credit_tool.aanalyze_credit_trends(customer_ids),
+            self.market_tool.aget_current_market_data()
+        )
         if not credit_result.success:
             return credit_result
         
-        # Get market conditions
-        market_result = self.market_tool.get_current_market_data()
-        
         # Combine analysis
         portfolio_analysis = {
             'credit_analysis': credit_result.data,
@@ -634,8 +1213,12 @@ class AgentToolManager:
         )
 
 # Utility functions for tool operations
+@functools.lru_cache(maxsize=8)
 def create_tool_config(base_url: str, **kwargs) -> MCPToolConfig:
-    """Create tool configuration with defaults"""
+    """Create tool configuration with defaults
+    
+    Configs are frozen, so identical arguments share one instance.
+    """
     return MCPToolConfig(base_url=base_url, **kwargs)
 
 def validate_tool_result(result: ToolResult, operation: str) -> bool:
@@ -672,4 +1255,29 @@ def retry_operation(operation_func, max_retries: int = 3,
                 logger.error(f"Operation failed after {max_retries} attempts: {str(e)}")
                 return ToolResult(success=False, error=str(e))
     
-    return ToolResult(success=False, error="Max retries exceeded") 
\ No newline at end of file
+    return ToolResult(success=False, error="Max retries exceeded") 
+
+async def aretry_operation(operation_func, max_retries: int = 3,
+                           delay: float = 1.0, backoff: float = 2.0):
+    """Retry an async operation with exponential backoff and full jitter"""
+    for attempt in range(max_retries):
+        try:
+            result = await operation_func()
+            if result.success:
+                return result
+            
+            if attempt < max_retries - 1:
+                sleep_time = random.uniform(0, delay * (backoff ** attempt))
+                logger.warning(f"Operation failed, retrying in {sleep_time:.1f}s (attempt {attempt + 1}/{max_retries})")
+                await asyncio.sleep(sleep_time)
+        
+        except Exception as e:
+            if attempt < max_retries - 1:
+                sleep_time = random.uniform(0, delay * (backoff ** attempt))
+                logger.error(f"Operation exception, retrying in {sleep_time:.1f}s: {str(e)}")
+                await asyncio.sleep(sleep_time)
+            else:
+                logger.error(f"Operation failed after {max_retries} attempts: {str(e)}")
+                return ToolResult(success=False, error=str(e))
+    
+    return ToolResult(success=False, error="Max retries exceeded")
@@ -7,10 +7,13 @@ Generates realistic synthetic data for testing and development of the credit ris
 import json
 import logging
 import random
+import re
 import string
+import tempfile
 import time
 from datetime import datetime, timedelta, date
 from typing import Dict, List, Any, Optional
+from concurrent.futures import ThreadPoolExecutor
 import mysql.connector
 from mysql.connector import pooling
 import os
@@ -28,6 +31,28 @@ logger = logging.getLogger(__name__)
 # Initialize Faker for realistic data generation
 fake = Faker()
 
+# Weighted distributions: more people in the middle credit score and income ranges
+CREDIT_SCORE_RANGES = [(300, 499), (500, 599), (600, 649), (650, 699), (700, 749), (750, 799), (800, 850)]
+CREDIT_SCORE_WEIGHTS = [0.05, 0.1, 0.2, 0.3, 0.2, 0.1, 0.05]
+INCOME_RANGES = [(20000, 50000), (50001, 80000), (80001, 120000), (120001, 200000), (200001, 500000)]
+INCOME_WEIGHTS = [0.3, 0.4, 0.2, 0.08, 0.02]
+
+# Rows sent per executemany call and committed together. The connector rewrites a
+# plain "INSERT INTO t (...) VALUES (...)" executemany into one multi-row INSERT, so
+# the insert_* statements keep that form; 5000 rows stay well under max_allowed_packet
+INSERT_BATCH_SIZE = 5000
+
+# Tables at least this large are bulk loaded with LOAD DATA LOCAL INFILE when the server allows it
+LOAD_DATA_MIN_ROWS = 1000
+
+_INSERT_TARGET = re.compile(r"INSERT\s+INTO\s+(\w+)\s*\(([^)]*)\)", re.I)
+
+def _load_data_field(value: Any) -> str:
+    """Format a value for LOAD DATA with fields enclosed by double quotes and no escape character"""
+    if value is None:
+        return 'NULL'
+    return '"' + str(value).replace('"', '""') + '"'
+
 class DatabaseConfig:
     """Database configuration"""
     
@@ -46,19 +71,32 @@ class SyntheticDataGenerator:
         self.db_config = db_config
         self.connection = None
         self.logger = logging.getLogger(self.__class__.__name__)
-        
+        self.rng = np.random.default_rng()
+        # Sequential IDs per prefix, so generated rows never collide on their primary keys
+        self._id_counters: Dict[str, int] = {}
+        self._run_stamp = datetime.now().strftime('%y%m%d%H%M%S')
+        # Cleared once the server refuses LOAD DATA LOCAL INFILE (local_infile is off by default)
+        self._load_data_enabled = True
+        
+    def _open_connection(self):
+        """Open a new connection with the generator's settings"""
+        return mysql.connector.connect(
+            host=self.db_config.host,
+            port=self.db_config.port,
+            database=self.db_config.database,
+            user=self.db_config.user,
+            password=self.db_config.password,
+            charset=self.db_config.charset,
+            autocommit=True,
+            allow_local_infile=True,
+            # C extension when installed; the connector falls back to pure Python otherwise
+            use_pure=False
+        )
+    
     def connect_database(self):
         """Connect to MySQL database"""
         try:
-            self.connection = mysql.connector.connect(
-                host=self.db_config.host,
-                port=self.db_config.port,
-                database=self.db_config.database,
-                user=self.db_config.user,
-                password=self.db_config.password,
-                charset=self.db_config.charset,
-                autocommit=True
-            )
+            self.connection = self._open_connection()
             self.logger.info("Connected to database successfully")
         except mysql.connector.Error as e:
             self.logger.error(f"Database connection failed: {str(e)}")
@@ -160,9 +198,15 @@ class SyntheticDataGenerator:
         
         cursor.close()
     
+    def _next_ids(self, prefix: str, count: int) -> List[str]:
+        """Reserve count sequential IDs for prefix; the run stamp keeps them apart from earlier runs"""
+        start = self._id_counters.get(prefix, 0)
+        self._id_counters[prefix] = start + count
+        return [f"{prefix}{self._run_stamp}{n:06d}" for n in range(start + 1, start + count + 1)]
+    
     def generate_customer_id(self) -> str:
         """Generate unique customer ID"""
-        return f"CUST{random.randint(100000, 999999)}"
+        return self._next_ids('CUST', 1)[0]
     
     def generate_ssn(self) -> str:
         """Generate realistic SSN"""
@@ -174,80 +218,119 @@ class SyntheticDataGenerator:
     
     def generate_credit_score(self) -> int:
         """Generate realistic credit score"""
-        # Weighted distribution: more people in middle ranges
-        weights = [0.05, 0.1, 0.2, 0.3, 0.2, 0.1, 0.05]
-        ranges = [(300, 499), (500, 599), (600, 649), (650, 699), (700, 749), (750, 799), (800, 850)]
-        chosen_range = random.choices(ranges, weights=weights)[0]
+        chosen_range = random.choices(CREDIT_SCORE_RANGES, weights=CREDIT_SCORE_WEIGHTS)[0]
         return random.randint(chosen_range[0], chosen_range[1])
     
     def generate_income(self) -> float:
         """Generate realistic annual income"""
-        # Weighted distribution for realistic income distribution
-        weights = [0.3, 0.4, 0.2, 0.08, 0.02]
-        ranges = [(20000, 50000), (50001, 80000), (80001, 120000), (120001, 200000), (200001, 500000)]
-        chosen_range = random.choices(ranges, weights=weights)[0]
+        chosen_range = random.choices(INCOME_RANGES, weights=INCOME_WEIGHTS)[0]
         return round(random.uniform(chosen_range[0], chosen_range[1]), 2)
     
+    def _draw_from_ranges(self, ranges: List[tuple], weights: List[float], count: int,
+                          integer: bool) -> np.ndarray:
+        """Draw count values, each from a range picked by weight"""
+        bounds = np.array(ranges)[self.rng.choice(len(ranges), p=weights, size=count)]
+        if integer:
+            return self.rng.integers(bounds[:, 0], bounds[:, 1], endpoint=True)
+        return np.round(self.rng.uniform(bounds[:, 0], bounds[:, 1]), 2)
+    
+    def _random_dates(self, oldest_days: int, newest_days: int, count: int) -> List[date]:
+        """Draw count dates uniformly between oldest_days and newest_days ago"""
+        today = date.today()
+        offsets = self.rng.integers(newest_days, oldest_days, size=count, endpoint=True).tolist()
+        return [today - timedelta(days=offset) for offset in offsets]
+    
     def generate_customer_data(self, count: int = 100) -> List[Dict[str, Any]]:
         """Generate synthetic customer data"""
-        customers = []
-        
-        for i in range(count):
-            customer = {
-                'customer_id': self.generate_customer_id(),
-                'name': fake.name(),
-                'email': fake.email(),
-                'phone': self.generate_phone(),
-                'date_of_birth': fake.date_of_birth(minimum_age=18, maximum_age=80),
-                'ssn': self.generate_ssn(),
-                'address': fake.street_address(),
-                'city': fake.city(),
-                'state': fake.state_abbr(),
-                'zip_code': fake.zipcode(),
-                'employment_status': random.choice(['Full-time', 'Part-time', 'Self-employed', 'Retired', 'Unemployed']),
-                'employer': fake.company() if random.random() > 0.1 else None,
-                'job_title': fake.job() if random.random() > 0.1 else None,
-                'annual_income': self.generate_income(),
-                'credit_score': self.generate_credit_score()
+        rng = self.rng
+        # Bound once; the Faker proxy otherwise resolves each provider method on every call
+        name, user_name, email_domain = fake.name, fake.user_name, fake.safe_domain_name
+        date_of_birth = fake.date_of_birth
+        street_address, city, state_abbr, zipcode = fake.street_address, fake.city, fake.state_abbr, fake.zipcode
+        company, job = fake.company, fake.job
+        
+        # Draw every numeric and categorical field for all customers at once
+        customer_ids = self._next_ids('CUST', count)
+        ssn_parts = np.column_stack([
+            rng.integers(100, 1000, size=count),
+            rng.integers(10, 100, size=count),
+            rng.integers(1000, 10000, size=count)
+        ]).tolist()
+        phone_parts = np.column_stack([
+            rng.integers(200, 1000, size=count),
+            rng.integers(100, 1000, size=count),
+            rng.integers(1000, 10000, size=count)
+        ]).tolist()
+        employment_statuses = rng.choice(
+            ['Full-time', 'Part-time', 'Self-employed', 'Retired', 'Unemployed'], size=count
+        ).tolist()
+        has_employer = (rng.random(count) > 0.1).tolist()
+        has_job_title = (rng.random(count) > 0.1).tolist()
+        incomes = self._draw_from_ranges(INCOME_RANGES, INCOME_WEIGHTS, count, integer=False).tolist()
+        credit_scores = self._draw_from_ranges(CREDIT_SCORE_RANGES, CREDIT_SCORE_WEIGHTS, count, integer=True).tolist()
+        
+        return [
+            {
+                'customer_id': customer_ids[i],
+                'name': name(),
+                # Faker emails repeat within a few thousand draws; the ID digits keep the UNIQUE column unique
+                'email': f"{user_name()}.{customer_ids[i][len('CUST'):]}@{email_domain()}",
+                'phone': "({}) {}-{}".format(*phone_parts[i]),
+                'date_of_birth': date_of_birth(minimum_age=18, maximum_age=80),
+                'ssn': "{}-{}-{}".format(*ssn_parts[i]),
+                'address': street_address(),
+                'city': city(),
+                'state': state_abbr(),
+                'zip_code': zipcode(),
+                'employment_status': employment_statuses[i],
+                'employer': company() if has_employer[i] else None,
+                'job_title': job() if has_job_title[i] else None,
+                'annual_income': incomes[i],
+                'credit_score': credit_scores[i]
             }
-            customers.append(customer)
-        
-        return customers
+            for i in range(count)
+        ]
     
     def generate_financial_records(self, customer_ids: List[str], records_per_customer: int = 10) -> List[Dict[str, Any]]:
         """Generate synthetic financial records"""
-        records = []
         record_types = ['Deposit', 'Withdrawal', 'Payment', 'Transfer', 'Fee', 'Interest']
         account_types = ['Checking', 'Savings', 'Credit Card', 'Investment', 'Loan']
         institutions = ['Bank of America', 'Chase', 'Wells Fargo', 'Citibank', 'US Bank', 'PNC Bank']
-        
-        for customer_id in customer_ids:
-            balance = random.uniform(1000, 50000)
-            
-            for i in range(records_per_customer):
-                record_type = random.choice(record_types)
-                amount = random.uniform(10, 5000)
-                
-                # Adjust balance based on transaction type
-                if record_type in ['Deposit', 'Payment']:
-                    balance += amount
-                else:
-                    balance = max(0, balance - amount)
-                
-                record = {
-                    'record_id': f"REC{random.randint(100000, 999999)}",
-                    'customer_id': customer_id,
-                    'record_type': record_type,
-                    'amount': round(amount, 2),
-                    'description': fake.sentence(),
-                    'transaction_date': fake.date_between(start_date='-1y', end_date='today'),
-                    'balance': round(balance, 2),
-                    'account_type': random.choice(account_types),
-                    'institution': random.choice(institutions)
-                }
-                records.append(record)
-        
-        return records
+        rng = self.rng
+        shape = (len(customer_ids), records_per_customer)
+        
+        type_indices = rng.integers(len(record_types), size=shape)
+        amounts = rng.uniform(10, 5000, size=shape)
+        
+        # Deposits and payments add to the balance, everything else draws it down but never below zero.
+        # That floored walk is the running sum lifted by its deepest dip below zero so far
+        signs = np.where(np.isin(type_indices, [record_types.index('Deposit'), record_types.index('Payment')]), 1.0, -1.0)
+        walk = rng.uniform(1000, 50000, size=(shape[0], 1)) + np.cumsum(signs * amounts, axis=1)
+        balances = walk - np.minimum(np.minimum.accumulate(walk, axis=1), 0)
+        
+        types = np.array(record_types)[type_indices].ravel().tolist()
+        amounts = np.round(amounts, 2).ravel().tolist()
+        balances = np.round(balances, 2).ravel().tolist()
+        record_ids = self._next_ids('REC', len(amounts))
+        account_choices = rng.choice(account_types, size=len(amounts)).tolist()
+        institution_choices = rng.choice(institutions, size=len(amounts)).tolist()
+        transaction_dates = self._random_dates(365, 0, len(amounts))  # the past year
+        sentence = fake.sentence
+        
+        return [
+            {
+                'record_id': record_ids[i],
+                'customer_id': customer_ids[i // records_per_customer],
+                'record_type': types[i],
+                'amount': amounts[i],
+                'description': sentence(),
+                'transaction_date': transaction_dates[i],
+                'balance': balances[i],
+                'account_type': account_choices[i],
+                'institution': institution_choices[i]
+            }
+            for i in range(len(amounts))
+        ]
     
     def generate_loan_applications(self, customer_ids: List[str], applications_per_customer: int = 2) -> List[Dict[str, Any]]:
         """Generate synthetic loan applications"""
@@ -256,6 +339,9 @@ class SyntheticDataGenerator:
         purposes = ['Debt Consolidation', 'Home Improvement', 'Vehicle Purchase', 'Education', 'Business Expansion', 'Emergency']
         collateral_types = ['Vehicle', 'Property', 'Investment', 'Equipment', 'None']
         statuses = ['Pending', 'Approved', 'Denied', 'Under Review', 'Conditional']
+        # Applications from the past six months
+        application_dates = iter(self._random_dates(183, 0, len(customer_ids) * applications_per_customer))
+        application_ids = iter(self._next_ids('APP', len(customer_ids) * applications_per_customer))
         
         for customer_id in customer_ids:
             for i in range(applications_per_customer):
@@ -278,7 +364,7 @@ class SyntheticDataGenerator:
                 interest_rate = round(base_rate + risk_adjustment, 2)
                 
                 application = {
-                    'application_id': f"APP{random.randint(100000, 999999)}",
+                    'application_id': next(application_ids),
                     'customer_id': customer_id,
                     'loan_type': loan_type,
                     'loan_amount': round(loan_amount, 2),
@@ -286,7 +372,7 @@ class SyntheticDataGenerator:
                     'purpose': random.choice(purposes),
                     'collateral_value': round(loan_amount * random.uniform(0.8, 1.2), 2) if random.random() > 0.3 else 0,
                     'collateral_type': random.choice(collateral_types),
-                    'application_date': fake.date_between(start_date='-6m', end_date='today'),
+                    'application_date': next(application_dates),
                     'status': random.choice(statuses),
                     'risk_score': risk_score,
                     'interest_rate': interest_rate
@@ -297,83 +383,163 @@ class SyntheticDataGenerator:
     
     def generate_market_data(self, days: int = 365) -> List[Dict[str, Any]]:
         """Generate synthetic market data"""
-        market_data = []
         indicators = ['Federal Funds Rate', 'Prime Rate', '30-Year Fixed Mortgage', '5-Year Treasury', 'S&P 500', 'Unemployment Rate']
         
         start_date = datetime.now() - timedelta(days=days)
-        
-        for i in range(days):
-            current_date = start_date + timedelta(days=i)
-            
-            for indicator in indicators:
-                # Generate realistic values for each indicator
-                if 'Rate' in indicator:
-                    base_value = random.uniform(2.0, 8.0)
-                elif 'Mortgage' in indicator:
-                    base_value = random.uniform(3.0, 7.0)
-                elif 'Treasury' in indicator:
-                    base_value = random.uniform(1.0, 5.0)
-                elif 'S&P' in indicator:
-                    base_value = random.uniform(3000, 5000)
-                else:
-                    base_value = random.uniform(3.0, 8.0)
-                
-                # Add some daily variation
-                daily_change = random.uniform(-0.1, 0.1)
-                value = round(base_value + daily_change, 4)
-                change_percent = round(daily_change / base_value * 100, 2)
-                
-                data_point = {
-                    'data_id': f"MRK{random.randint(100000, 999999)}",
-                    'date': current_date.date(),
-                    'indicator': indicator,
-                    'value': value,
-                    'change_percent': change_percent,
-                    'source': 'Synthetic Market Data'
-                }
-                market_data.append(data_point)
-        
-        return market_data
+        dates = [(start_date + timedelta(days=i)).date() for i in range(days)]
+        
+        # Realistic value range for each indicator
+        bounds = []
+        for indicator in indicators:
+            if 'Rate' in indicator:
+                bounds.append((2.0, 8.0))
+            elif 'Mortgage' in indicator:
+                bounds.append((3.0, 7.0))
+            elif 'Treasury' in indicator:
+                bounds.append((1.0, 5.0))
+            elif 'S&P' in indicator:
+                bounds.append((3000, 5000))
+            else:
+                bounds.append((3.0, 8.0))
+        bounds = np.array(bounds)
+        
+        # One (days, indicators) grid per quantity, plus some daily variation
+        base_values = self.rng.uniform(bounds[:, 0], bounds[:, 1], size=(days, len(indicators)))
+        daily_changes = self.rng.uniform(-0.1, 0.1, size=(days, len(indicators)))
+        values = np.round(base_values + daily_changes, 4).tolist()
+        change_percents = np.round(daily_changes / base_values * 100, 2).tolist()
+        data_ids = self._next_ids('MRK', days * len(indicators))
+        
+        return [
+            {
+                'data_id': data_ids[i * len(indicators) + j],
+                'date': dates[i],
+                'indicator': indicator,
+                'value': values[i][j],
+                'change_percent': change_percents[i][j],
+                'source': 'Synthetic Market Data'
+            }
+            for i in range(days)
+            for j, indicator in enumerate(indicators)
+        ]
     
     def generate_credit_history(self, customer_ids: List[str], accounts_per_customer: int = 3) -> List[Dict[str, Any]]:
         """Generate synthetic credit history"""
-        credit_history = []
         account_types = ['Credit Card', 'Auto Loan', 'Personal Loan', 'Mortgage', 'Student Loan']
         institutions = ['Chase', 'Bank of America', 'Wells Fargo', 'Citibank', 'American Express', 'Discover']
         statuses = ['Open', 'Closed', 'Delinquent', 'Paid Off']
+        rng = self.rng
+        count = len(customer_ids) * accounts_per_customer
+        
+        credit_limits = rng.uniform(1000, 50000, size=count)
+        current_balances = np.round(rng.uniform(0, credit_limits * 0.8), 2).tolist()
+        credit_limits = np.round(credit_limits, 2).tolist()
+        history_ids = self._next_ids('CRD', count)
+        account_numbers = rng.integers(1000, 10000, size=count).tolist()
+        account_choices = rng.choice(account_types, size=count).tolist()
+        institution_choices = rng.choice(institutions, size=count).tolist()
+        status_choices = rng.choice(statuses, size=count).tolist()
+        open_dates = self._random_dates(1826, 183, count)  # five years to six months ago
+        
+        # Generate payment history (24 months) for every account at once; the statuses need no
+        # JSON escaping, so each row is formatted directly in json.dumps' layout
+        payment_months = rng.choice(['On Time', 'Late', 'Missed'], p=[0.85, 0.12, 0.03], size=(count, 24)).tolist()
+        payment_histories = ['["' + '", "'.join(months) + '"]' for months in payment_months]
+        
+        return [
+            {
+                'history_id': history_ids[i],
+                'customer_id': customer_ids[i // accounts_per_customer],
+                'account_type': account_choices[i],
+                'account_number': f"****{account_numbers[i]}",
+                'institution': institution_choices[i],
+                'credit_limit': credit_limits[i],
+                'current_balance': current_balances[i],
+                'payment_history': payment_histories[i],
+                'open_date': open_dates[i],
+                'status': status_choices[i]
+            }
+            for i in range(count)
+        ]
+    
+    def _insert_rows(self, insert_sql: str, rows: List[tuple], label: str, connection=None,
+                     skip_checks: bool = False) -> int:
+        """Insert rows with executemany in batches, committing once per batch"""
+        if connection is None:
+            connection = self.connection
+        cursor = connection.cursor()
+        autocommit = connection.autocommit
+        connection.autocommit = False
+        inserted = 0
+        
+        # Only for child tables: their rows reference customers already confirmed stored, and
+        # their only unique index is the primary key, which InnoDB enforces regardless
+        if skip_checks:
+            cursor.execute("SET foreign_key_checks = 0, unique_checks = 0")
         
-        for customer_id in customer_ids:
-            for i in range(accounts_per_customer):
-                account_type = random.choice(account_types)
-                credit_limit = random.uniform(1000, 50000)
-                current_balance = random.uniform(0, credit_limit * 0.8)
-                
-                # Generate payment history (24 months)
-                payment_history = []
-                for month in range(24):
-                    payment_status = random.choices(['On Time', 'Late', 'Missed'], weights=[0.85, 0.12, 0.03])[0]
-                    payment_history.append(payment_status)
-                
-                history = {
-                    'history_id': f"CRD{random.randint(100000, 999999)}",
-                    'customer_id': customer_id,
-                    'account_type': account_type,
-                    'account_number': f"****{random.randint(1000, 9999)}",
-                    'institution': random.choice(institutions),
-                    'credit_limit': round(credit_limit, 2),
-                    'current_balance': round(current_balance, 2),
-                    'payment_history': json.dumps(payment_history),
-                    'open_date': fake.date_between(start_date='-5y', end_date='-6m'),
-                    'status': random.choice(statuses)
-                }
-                credit_history.append(history)
+        try:
+            if self._load_data_enabled and len(rows) >= LOAD_DATA_MIN_ROWS:
+                loaded = self._load_rows(connection, cursor, insert_sql, rows)
+                if loaded is not None:
+                    self.logger.info(f"Loaded {loaded} {label}")
+                    return loaded
+            
+            for start in range(0, len(rows), INSERT_BATCH_SIZE):
+                batch = rows[start:start + INSERT_BATCH_SIZE]
+                try:
+                    cursor.executemany(insert_sql, batch)
+                    connection.commit()
+                    inserted += len(batch)
+                except mysql.connector.Error as e:
+                    # Retry the failed batch row by row so one bad row only costs itself
+                    connection.rollback()
+                    self.logger.warning(f"Batch insert of {label} failed, inserting row by row: {str(e)}")
+                    for row in batch:
+                        try:
+                            cursor.execute(insert_sql, row)
+                            inserted += 1
+                        except mysql.connector.Error as e:
+                            self.logger.warning(f"Could not insert {label} row {row[0]}: {str(e)}")
+                    connection.commit()
+        finally:
+            if skip_checks:
+                cursor.execute("SET foreign_key_checks = 1, unique_checks = 1")
+            cursor.close()
+            connection.autocommit = autocommit
         
-        return credit_history
+        self.logger.info(f"Inserted {inserted} {label}")
+        return inserted
     
-    def insert_customers(self, customers: List[Dict[str, Any]]):
-        """Insert customers into database"""
-        cursor = self.connection.cursor()
+    def _load_rows(self, connection, cursor, insert_sql: str, rows: List[tuple]) -> Optional[int]:
+        """Bulk load rows through a temporary file; None if the server refuses LOAD DATA LOCAL"""
+        table, columns = _INSERT_TARGET.search(insert_sql).groups()
+        
+        with tempfile.NamedTemporaryFile('w', suffix='.csv', encoding='utf-8', newline='', delete=False) as f:
+            for row in rows:
+                f.write(','.join(_load_data_field(value) for value in row))
+                f.write('\n')
+            path = f.name
         
+        try:
+            cursor.execute(f"""
+                LOAD DATA LOCAL INFILE %s INTO TABLE {table}
+                CHARACTER SET {self.db_config.charset}
+                FIELDS TERMINATED BY ',' ENCLOSED BY '"' ESCAPED BY ''
+                LINES TERMINATED BY '\\n'
+                ({columns})
+            """, (path,))
+            connection.commit()
+            return cursor.rowcount
+        except mysql.connector.Error as e:
+            connection.rollback()
+            self._load_data_enabled = False
+            self.logger.info(f"LOAD DATA LOCAL INFILE unavailable, using batched inserts: {str(e)}")
+            return None
+        finally:
+            os.remove(path)
+    
+    def insert_customers(self, customers: List[Dict[str, Any]], connection=None):
+        """Insert customers into database"""
         insert_sql = """
             INSERT INTO customers (
                 customer_id, name, email, phone, date_of_birth, ssn, address, 
@@ -384,27 +550,22 @@ class SyntheticDataGenerator:
             )
         """
         
-        for customer in customers:
-            try:
-                cursor.execute(insert_sql, (
-                    customer['customer_id'], customer['name'], customer['email'],
-                    customer['phone'], customer['date_of_birth'], customer['ssn'],
-                    customer['address'], customer['city'], customer['state'],
-                    customer['zip_code'], customer['employment_status'],
-                    customer['employer'], customer['job_title'],
-                    customer['annual_income'], customer['credit_score']
-                ))
-            except mysql.connector.Error as e:
-                self.logger.warning(f"Could not insert customer {customer['customer_id']}: {str(e)}")
-        
-        self.connection.commit()
-        cursor.close()
-        self.logger.info(f"Inserted {len(customers)} customers")
+        rows = [
+            (
+                customer['customer_id'], customer['name'], customer['email'],
+                customer['phone'], customer['date_of_birth'], customer['ssn'],
+                customer['address'], customer['city'], customer['state'],
+                customer['zip_code'], customer['employment_status'],
+                customer['employer'], customer['job_title'],
+                customer['annual_income'], customer['credit_score']
+            )
+            for customer in customers
+        ]
+        self._insert_rows(insert_sql, rows, "customers", connection)
     
-    def insert_financial_records(self, records: List[Dict[str, Any]]):
+    def insert_financial_records(self, records: List[Dict[str, Any]], connection=None,
+                                 skip_checks: bool = False):
         """Insert financial records into database"""
-        cursor = self.connection.cursor()
-        
         insert_sql = """
             INSERT INTO financial_records (
                 record_id, customer_id, record_type, amount, description,
@@ -412,24 +573,19 @@ class SyntheticDataGenerator:
             ) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s)
         """
         
-        for record in records:
-            try:
-                cursor.execute(insert_sql, (
-                    record['record_id'], record['customer_id'], record['record_type'],
-                    record['amount'], record['description'], record['transaction_date'],
-                    record['balance'], record['account_type'], record['institution']
-                ))
-            except mysql.connector.Error as e:
-                self.logger.warning(f"Could not insert record {record['record_id']}: {str(e)}")
-        
-        self.connection.commit()
-        cursor.close()
-        self.logger.info(f"Inserted {len(records)} financial records")
+        rows = [
+            (
+                record['record_id'], record['customer_id'], record['record_type'],
+                record['amount'], record['description'], record['transaction_date'],
+                record['balance'], record['account_type'], record['institution']
+            )
+            for record in records
+        ]
+        self._insert_rows(insert_sql, rows, "financial records", connection, skip_checks)
     
-    def insert_loan_applications(self, applications: List[Dict[str, Any]]):
+    def insert_loan_applications(self, applications: List[Dict[str, Any]], connection=None,
+                                 skip_checks: bool = False):
         """Insert loan applications into database"""
-        cursor = self.connection.cursor()
-        
         insert_sql = """
             INSERT INTO loan_applications (
                 application_id, customer_id, loan_type, loan_amount, term_months,
@@ -438,51 +594,40 @@ class SyntheticDataGenerator:
             ) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
         """
         
-        for application in applications:
-            try:
-                cursor.execute(insert_sql, (
-                    application['application_id'], application['customer_id'],
-                    application['loan_type'], application['loan_amount'],
-                    application['term_months'], application['purpose'],
-                    application['collateral_value'], application['collateral_type'],
-                    application['application_date'], application['status'],
-                    application['risk_score'], application['interest_rate']
-                ))
-            except mysql.connector.Error as e:
-                self.logger.warning(f"Could not insert application {application['application_id']}: {str(e)}")
-        
-        self.connection.commit()
-        cursor.close()
-        self.logger.info(f"Inserted {len(applications)} loan applications")
+        rows = [
+            (
+                application['application_id'], application['customer_id'],
+                application['loan_type'], application['loan_amount'],
+                application['term_months'], application['purpose'],
+                application['collateral_value'], application['collateral_type'],
+                application['application_date'], application['status'],
+                application['risk_score'], application['interest_rate']
+            )
+            for application in applications
+        ]
+        self._insert_rows(insert_sql, rows, "loan applications", connection, skip_checks)
     
-    def insert_market_data(self, market_data: List[Dict[str, Any]]):
+    def insert_market_data(self, market_data: List[Dict[str, Any]], connection=None):
         """Insert market data into database"""
-        cursor = self.connection.cursor()
-        
         insert_sql = """
             INSERT INTO market_data (
                 data_id, date, indicator, value, change_percent, source
             ) VALUES (%s, %s, %s, %s, %s, %s)
         """
         
-        for data_point in market_data:
-            try:
-                cursor.execute(insert_sql, (
-                    data_point['data_id'], data_point['date'],
-                    data_point['indicator'], data_point['value'],
-                    data_point['change_percent'], data_point['source']
-                ))
-            except mysql.connector.Error as e:
-                self.logger.warning(f"Could not insert market data {data_point['data_id']}: {str(e)}")
-        
-        self.connection.commit()
-        cursor.close()
-        self.logger.info(f"Inserted {len(market_data)} market data points")
+        rows = [
+            (
+                data_point['data_id'], data_point['date'],
+                data_point['indicator'], data_point['value'],
+                data_point['change_percent'], data_point['source']
+            )
+            for data_point in market_data
+        ]
+        self._insert_rows(insert_sql, rows, "market data points", connection)
     
-    def insert_credit_history(self, credit_history: List[Dict[str, Any]]):
+    def insert_credit_history(self, credit_history: List[Dict[str, Any]], connection=None,
+                              skip_checks: bool = False):
         """Insert credit history into database"""
-        cursor = self.connection.cursor()
-        
         insert_sql = """
             INSERT INTO credit_history (
                 history_id, customer_id, account_type, account_number,
@@ -491,21 +636,42 @@ class SyntheticDataGenerator:
             ) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
         """
         
-        for history in credit_history:
-            try:
-                cursor.execute(insert_sql, (
-                    history['history_id'], history['customer_id'],
-                    history['account_type'], history['account_number'],
-                    history['institution'], history['credit_limit'],
-                    history['current_balance'], history['payment_history'],
-                    history['open_date'], history['status']
-                ))
-            except mysql.connector.Error as e:
-                self.logger.warning(f"Could not insert credit history {history['history_id']}: {str(e)}")
+        rows = [
+            (
+                history['history_id'], history['customer_id'],
+                history['account_type'], history['account_number'],
+                history['institution'], history['credit_limit'],
+                history['current_balance'], history['payment_history'],
+                history['open_date'], history['status']
+            )
+            for history in credit_history
+        ]
+        self._insert_rows(insert_sql, rows, "credit history records", connection, skip_checks)
+    
+    def _insert_on_new_connection(self, insert, rows: List[Dict[str, Any]], **kwargs):
+        """Run an insert_* method on a connection of its own, for use from worker threads"""
+        connection = self._open_connection()
+        try:
+            insert(rows, connection=connection, **kwargs)
+        finally:
+            connection.close()
+    
+    def _stored_customer_ids(self, customer_ids: List[str]) -> List[str]:
+        """Return the customer_ids that actually made it into the customers table"""
+        cursor = self.connection.cursor()
+        try:
+            cursor.execute(
+                "SELECT customer_id FROM customers WHERE customer_id LIKE %s",
+                (f"CUST{self._run_stamp}%",)
+            )
+            stored = {row[0] for row in cursor.fetchall()}
+        finally:
+            cursor.close()
         
-        self.connection.commit()
-        cursor.close()
-        self.logger.info(f"Inserted {len(credit_history)} credit history records")
+        missing = len(customer_ids) - len(stored.intersection(customer_ids))
+        if missing:
+            self.logger.warning(f"{missing} customers were not inserted; skipping their child records")
+        return [customer_id for customer_id in customer_ids if customer_id in stored]
     
     def generate_all_data(self, customer_count: int = 100, days_of_market_data: int = 365):
         """Generate and insert all synthetic data"""
@@ -523,27 +689,40 @@ class SyntheticDataGenerator:
             customers = self.generate_customer_data(customer_count)
             self.insert_customers(customers)
             
-            customer_ids = [c['customer_id'] for c in customers]
-            
-            # Generate financial records
-            self.logger.info("Generating financial records...")
-            financial_records = self.generate_financial_records(customer_ids, records_per_customer=15)
-            self.insert_financial_records(financial_records)
-            
-            # Generate loan applications
-            self.logger.info("Generating loan applications...")
-            loan_applications = self.generate_loan_applications(customer_ids, applications_per_customer=3)
-            self.insert_loan_applications(loan_applications)
+            # Child rows are generated only for customers that were stored, so they cannot be
+            # orphaned and their loads can skip the foreign key checks
+            customer_ids = self._stored_customer_ids([c['customer_id'] for c in customers])
             
-            # Generate market data
-            self.logger.info(f"Generating {days_of_market_data} days of market data...")
-            market_data = self.generate_market_data(days_of_market_data)
-            self.insert_market_data(market_data)
-            
-            # Generate credit history
-            self.logger.info("Generating credit history...")
-            credit_history = self.generate_credit_history(customer_ids, accounts_per_customer=4)
-            self.insert_credit_history(credit_history)
+            # The remaining tables only reference customers, so each loads on its own connection
+            # while the next one is generated
+            with ThreadPoolExecutor(max_workers=4, thread_name_prefix="data-insert") as executor:
+                inserts = []
+                
+                # Generate financial records
+                self.logger.info("Generating financial records...")
+                financial_records = self.generate_financial_records(customer_ids, records_per_customer=15)
+                inserts.append(executor.submit(self._insert_on_new_connection, self.insert_financial_records, financial_records,
+                                               skip_checks=True))
+                
+                # Generate loan applications
+                self.logger.info("Generating loan applications...")
+                loan_applications = self.generate_loan_applications(customer_ids, applications_per_customer=3)
+                inserts.append(executor.submit(self._insert_on_new_connection, self.insert_loan_applications, loan_applications,
+                                               skip_checks=True))
+                
+                # Generate market data
+                self.logger.info(f"Generating {days_of_market_data} days of market data...")
+                market_data = self.generate_market_data(days_of_market_data)
+                inserts.append(executor.submit(self._insert_on_new_connection, self.insert_market_data, market_data))
+                
+                # Generate credit history
+                self.logger.info("Generating credit history...")
+                credit_history = self.generate_credit_history(customer_ids, accounts_per_customer=4)
+                inserts.append(executor.submit(self._insert_on_new_connection, self.insert_credit_history, credit_history,
+                                               skip_checks=True))
+                
+                for insert in inserts:
+                    insert.result()
             
             self.logger.info("Synthetic data generation completed successfully!")
             